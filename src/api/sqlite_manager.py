@@ -1,8 +1,10 @@
 import sqlite3
 import logging
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
 
+from api.sqlite_pool import SQLitePool, get_pool
+
 
 class DeliveryStatus(Enum):
     """
@@ -26,6 +28,8 @@ class SQLiteManager:
 
     This class is designed to be used as a context manager to ensure
     that database connections are handled safely and automatically.
+    Connections are borrowed from a process-wide SQLitePool and given back
+    on exit, instead of opening the database file on every use.
 
     Table 1 Schema:
     DeliverymenMapping (
@@ -43,12 +47,17 @@ class SQLiteManager:
     )
     """
 
-    def __init__(self, db_path: str):
+    # Max bound parameters per statement on older SQLite builds
+    MAX_QUERY_PARAMS = 999
+
+    def __init__(self, db_path: str, read_only: bool = False):
         """
         Initializes the database manager.
 
         Args:
             db_path (str): The file path to the SQLite database.
+            read_only (bool): Use one of the pool's read-only connections,
+                              which don't wait for the writer.
         """
         if db_path is None:
             # This check is good, although the type hint `str` implies non-None.
@@ -58,11 +67,33 @@ class SQLiteManager:
 
         self.logger = logging.getLogger(__name__)
         self.db_path = db_path
+        self.read_only = read_only
         self.conn: Optional[sqlite3.Connection] = None
 
+    def _get_pool(self) -> SQLitePool:
+        """
+        Returns the connection pool for this database. The first call
+        opens the database and creates the tables if they don't exist.
+        """
+        return get_pool(
+            self.db_path, self._configure_connection, self._initialize_database
+        )
+
+    def warm_up(self):
+        """Sets up the database and its connection pool ahead of the first task."""
+        try:
+            self._get_pool()
+        except sqlite3.Error:
+            self.logger.exception(
+                f"Erro ao conectar ao banco de dados em {self.db_path}."
+            )
+            raise
+
     def __enter__(self) -> "SQLiteManager":
         """
-        Opens the database connection and creates the tables if they don't exist.
+        Takes a connection from the pool (setting up the database on first use).
+        On the read-write connection, everything done inside the 'with' block
+        runs in a single BEGIN IMMEDIATE transaction, committed once on exit.
 
         This method is called when entering a 'with' statement.
 
@@ -70,22 +101,19 @@ class SQLiteManager:
             SQLiteManager: The current instance of the class.
         """
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            # This tells SQLite: "When I delete rows, shrink the file immediately."
-            self.conn.execute("PRAGMA auto_vacuum = 1;")
-
-            # Enable WAL Mode
-            # This allows concurrent readers and writers.
-            self.conn.execute("PRAGMA journal_mode = WAL;")
-
-            # Optimize Synchronization
-            # 'NORMAL' is safe for WAL and much faster than default 'FULL'.
-            self.conn.execute("PRAGMA synchronous = NORMAL;")
-
-            # Foreign Keys
-            self.conn.execute("PRAGMA foreign_keys = ON;")
-
-            self._create_tables()
+            pool = self._get_pool()
+            if self.read_only:
+                self.conn = pool.acquire_ro()
+            else:
+                conn = pool.acquire_rw()
+                try:
+                    # Takes the write lock upfront, so the transaction can't
+                    # fail halfway when upgrading from a read lock
+                    conn.execute("BEGIN IMMEDIATE")
+                except sqlite3.Error:
+                    pool.release(conn, read_only=False)
+                    raise
+                self.conn = conn
             return self
         except sqlite3.Error:
             self.logger.exception(
@@ -95,7 +123,7 @@ class SQLiteManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Closes the database connection, committing or rolling back changes.
+        Returns the connection to the pool, committing or rolling back changes.
 
         - If no exception occurred (exc_type is None), changes are committed.
         - If an exception occurred, changes are rolled back.
@@ -114,8 +142,29 @@ class SQLiteManager:
             except sqlite3.Error:
                 self.logger.exception("Erro durante saída.")
             finally:
-                self.conn.close()
-                self.conn = None
+                self._release_connection()
+
+    def _release_connection(self):
+        """
+        Returns the connection to the pool. A transaction left open (e.g. a
+        failed commit) is rolled back first, so the next BEGIN doesn't fail;
+        if that fails too, the connection is replaced.
+        """
+        conn = self._get_conn()
+        self.conn = None
+        pool = self._get_pool()
+
+        if conn.in_transaction:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                self.logger.exception(
+                    "Falha ao desfazer transação pendente; descartando conexão."
+                )
+                pool.discard(conn, self.read_only)
+                return
+
+        pool.release(conn, self.read_only)
 
     def _get_conn(self) -> sqlite3.Connection:
         """
@@ -131,14 +180,47 @@ class SQLiteManager:
             raise ConnectionError("Conexão fechada. Utilize o contexto 'with'.")
         return self.conn
 
-    def _create_tables(self):
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """
+        Applies the per-connection settings. These are not stored in the
+        database file, so every new connection needs them.
+        """
+        # Optimize Synchronization
+        # 'NORMAL' is safe for WAL and much faster than default 'FULL'.
+        conn.execute("PRAGMA synchronous = NORMAL;")
+
+        # Wait for a competing writer instead of failing with "database is locked"
+        conn.execute("PRAGMA busy_timeout = 30000;")
+
+        # Keep temporary tables and indices in memory
+        conn.execute("PRAGMA temp_store = MEMORY;")
+
+        # Page cache of ~20MB (negative values are in KiB)
+        conn.execute("PRAGMA cache_size = -20000;")
+
+        # Foreign Keys
+        conn.execute("PRAGMA foreign_keys = ON;")
+
+    def _initialize_database(self, conn: sqlite3.Connection):
+        """
+        Applies the settings that persist in the database file and
+        creates the tables. Only needed once per file.
+        """
+        # This tells SQLite: "When I delete rows, shrink the file immediately."
+        conn.execute("PRAGMA auto_vacuum = 1;")
+
+        # Enable WAL Mode
+        # This allows concurrent readers and writers.
+        conn.execute("PRAGMA journal_mode = WAL;")
+
+        self._create_tables(conn)
+
+    def _create_tables(self, conn: sqlite3.Connection):
         """
         Internal method to create all required tables.
 
         Uses 'CREATE TABLE IF NOT EXISTS' to be idempotent (safe to run multiple times).
         """
-        conn = self._get_conn()
-
         create_deliverymen_table_query = """
         CREATE TABLE IF NOT EXISTS DeliverymenMapping (
             velide_id TEXT PRIMARY KEY NOT NULL,
@@ -238,16 +320,18 @@ class SQLiteManager:
             # 1. Get the list of IDs we are trying to update
             incoming_ids = [m[0] for m in mappings]
             
-            # 2. Fetch the CURRENT state of these IDs from the DB
-            # Note: If list is massive (>900 items), consider chunking this part.
-            placeholders = ','.join('?' * len(incoming_ids))
-            query = (
-                "SELECT velide_id, local_id "
-                f"FROM DeliverymenMapping WHERE velide_id IN ({placeholders})"
-            )
-            
-            cursor.execute(query, incoming_ids)
-            existing_rows = dict(cursor.fetchall())  
+            # 2. Fetch the CURRENT state of these IDs from the DB,
+            # in chunks to stay under SQLite's bound parameter limit
+            existing_rows: Dict[str, str] = {}
+            for start in range(0, len(incoming_ids), self.MAX_QUERY_PARAMS):
+                chunk = incoming_ids[start:start + self.MAX_QUERY_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                query = (
+                    "SELECT velide_id, local_id "
+                    f"FROM DeliverymenMapping WHERE velide_id IN ({placeholders})"
+                )
+                cursor.execute(query, chunk)
+                existing_rows.update(cursor.fetchall())
 
             # 3. Filter: Keep only New rows OR rows where values differ
             to_insert = []
@@ -266,7 +350,9 @@ class SQLiteManager:
                 )
                 return 0
 
-            # 5. Execute INSERT OR REPLACE only on the real changes
+            # 5. Execute INSERT OR REPLACE only on the real changes.
+            # All rows go in the transaction opened by the first statement,
+            # committed once in __exit__.
             # We use REPLACE to handle the 'Unique' constraint 
             # on local_id automatically.
             # (It will 'steal' the local_id from another user if necessary).
@@ -443,16 +529,26 @@ class SQLiteManager:
             )
             return 0
 
-        # Convert Enum objects to their string values for the database
-        data_to_insert = [(ext, int_id, stat.value) for ext, int_id, stat in mappings]
-
-        query = (
+        # Rows per statement: each row binds 3 parameters
+        rows_per_statement = self.MAX_QUERY_PARAMS // 3
+        query_prefix = (
             "INSERT OR IGNORE INTO DeliveryMapping "
-            "(external_delivery_id, internal_delivery_id, status) VALUES (?, ?, ?)"
+            "(external_delivery_id, internal_delivery_id, status) VALUES "
         )
         try:
-            cursor = conn.executemany(query, data_to_insert)
-            inserted_count = cursor.rowcount
+            # Multi-row INSERTs, all in the single transaction committed in
+            # __exit__. Only the last, shorter chunk needs a different statement.
+            inserted_count = 0
+            for i in range(0, len(mappings), rows_per_statement):
+                chunk = mappings[i : i + rows_per_statement]
+                query = query_prefix + ", ".join(["(?, ?, ?)"] * len(chunk))
+                # Enum objects are stored as their string values
+                params = [
+                    value
+                    for ext, int_id, stat in chunk
+                    for value in (ext, int_id, stat.value)
+                ]
+                inserted_count += conn.execute(query, params).rowcount
             self.logger.debug(
                 f"Processados {len(mappings)} mapeamentos de entrega. "
                 f"{inserted_count} novos inseridos."
@@ -0,0 +1,221 @@
+import logging
+import os
+import pathlib
+import queue
+import sqlite3
+import threading
+from typing import Callable, Dict, Optional
+
+
+class SQLitePool:
+    """
+    Keeps long-lived connections to a SQLite database, so tasks don't pay
+    for opening the file and configuring a connection every time.
+
+    Holds a single read-write connection, which also serializes writers, and
+    up to 'max_readers' read-only connections (opened on demand). In WAL mode
+    readers don't block the writer and vice versa.
+
+    Connections are shared between threads, but only one thread uses a
+    connection at a time: it's taken out of the pool on acquire and put back
+    on release.
+
+    The read-write connection is in autocommit mode (isolation_level=None):
+    the sqlite3 module doesn't open transactions on its own, the borrower
+    starts one explicitly.
+    """
+
+    # Read-only connections kept per database
+    DEFAULT_MAX_READERS = 2
+    # How long close() waits for a busy read-write connection (seconds)
+    DEFAULT_CLOSE_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        db_path: str,
+        configure: Callable[[sqlite3.Connection], None],
+        initialize: Callable[[sqlite3.Connection], None],
+        max_readers: int = DEFAULT_MAX_READERS,
+    ):
+        """
+        Opens the read-write connection and prepares the database.
+
+        Args:
+            db_path (str): The file path to the SQLite database.
+            configure: Applies the per-connection settings to a new connection.
+            initialize: Prepares the database file (schema, journal mode).
+                        Called once, with the read-write connection.
+            max_readers (int): Max number of read-only connections.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self._configure = configure
+        self._max_readers = max_readers
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._readers_opened = 0
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        # None stands for a discarded writer, reopened by the next acquirer
+        self._writer: "queue.Queue[Optional[sqlite3.Connection]]" = queue.Queue(
+            maxsize=1
+        )
+
+        # The writer is opened first: it creates the file and the tables
+        # the read-only connections depend on.
+        writer = self._open(read_only=False)
+        try:
+            initialize(writer)
+            writer.commit()
+        except sqlite3.Error:
+            writer.close()
+            raise
+        self._writer.put(writer)
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """Opens and configures a new connection."""
+        if read_only:
+            uri = pathlib.Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+        try:
+            self._configure(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def acquire_rw(self) -> sqlite3.Connection:
+        """Takes the read-write connection, waiting while another task has it."""
+        conn = self._writer.get()
+        if self._closed:
+            if conn is not None:
+                conn.close()
+            # Wakes the next waiter, which fails the same way
+            self._writer.put(None)
+            raise sqlite3.ProgrammingError("Cannot operate on a closed pool.")
+        if conn is not None:
+            return conn
+
+        try:
+            return self._open(read_only=False)
+        except sqlite3.Error:
+            self._writer.put(None)
+            raise
+
+    def acquire_ro(self) -> sqlite3.Connection:
+        """Takes an idle read-only connection, opening one if the pool allows."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed pool.")
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._readers_opened < self._max_readers
+            if can_open:
+                self._readers_opened += 1
+
+        if not can_open:
+            return self._readers.get()
+
+        try:
+            return self._open(read_only=True)
+        except sqlite3.Error:
+            with self._lock:
+                self._readers_opened -= 1
+            raise
+
+    def release(self, conn: sqlite3.Connection, read_only: bool):
+        """
+        Puts a connection back. Any open transaction must be finished.
+        Once the pool is closed, the connection is closed instead.
+        """
+        if self._closed:
+            conn.close()
+            if not read_only:
+                self._writer.put(None)
+            return
+        if read_only:
+            self._readers.put(conn)
+        else:
+            self._writer.put(conn)
+
+    def discard(self, conn: sqlite3.Connection, read_only: bool):
+        """
+        Closes a connection left in a bad state instead of putting it back.
+        A new one is opened in its place when it's needed.
+        """
+        try:
+            conn.close()
+        except sqlite3.Error:
+            self.logger.exception("Erro ao fechar conexão descartada.")
+
+        if read_only:
+            with self._lock:
+                self._readers_opened -= 1
+        else:
+            self._writer.put(None)
+
+    def close(self, timeout: float = DEFAULT_CLOSE_TIMEOUT):
+        """
+        Closes the pool's connections. Connections in use are closed when
+        released, except the read-write one, which is waited for up to
+        'timeout' seconds: it's closed last, so SQLite checkpoints the WAL
+        into the database file.
+        """
+        with self._lock:
+            self._closed = True
+
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+        try:
+            writer = self._writer.get(timeout=timeout)
+        except queue.Empty:
+            self.logger.warning(
+                "Conexão de escrita ainda em uso; será fechada ao ser liberada."
+            )
+            return
+        if writer is not None:
+            writer.close()
+        self._writer.put(None)
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(
+    db_path: str,
+    configure: Callable[[sqlite3.Connection], None],
+    initialize: Callable[[sqlite3.Connection], None],
+) -> SQLitePool:
+    """
+    Returns the process-wide pool for 'db_path', creating it on first use.
+    See SQLitePool for the arguments.
+    """
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = SQLitePool(db_path, configure, initialize)
+            _pools[db_path] = pool
+        return pool
+
+
+def close_pool(db_path: str):
+    """
+    Closes the pool for 'db_path', if there is one. A later get_pool()
+    call for the same path opens a new pool.
+    """
+    with _pools_lock:
+        pool = _pools.pop(db_path, None)
+    if pool is not None:
+        pool.close()
@@ -114,6 +114,7 @@ class Velide:
         api_config: ApiConfig,
         target_system: TargetSystem,
         reconciliation_config: Optional[ReconciliationConfig] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the Velide API client.
@@ -123,11 +124,18 @@ class Velide:
             api_config: Configuration object containing URL, timeout, SSL settings
             target_system: The integration target identifier
             reconciliation_config: Optional configuration for reconciliation on retry
+            http_client: Optional long-lived HTTP client to send requests with.
+                         It's not closed on exit, so its connections are reused.
+                         If not given, a client is created for the 'async with' block.
         """
         self._access_token = access_token
         self._api_config = api_config
         self._target_system = target_system
+        self._shared_client = http_client
         self._client: Optional[httpx.AsyncClient] = None
+        # Sent with every request when using a shared client,
+        # as its headers can't carry the token
+        self._request_headers: Optional[Dict[str, str]] = None
         self._reconciliation_config = reconciliation_config
         self._reconciliation_strategy: Optional[DeliveryReconciliationStrategy] = None
 
@@ -143,6 +151,11 @@ class Velide:
 
     async def __aenter__(self):
         """Called when entering the 'async with' block."""
+        if self._shared_client is not None:
+            self._client = self._shared_client
+            self._request_headers = {"Authorization": self._access_token}
+            return self
+
         # Create headers dict here
         headers = {
             "Content-Type": "application/json",
@@ -158,8 +171,8 @@ class Velide:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Called when exiting the 'async with' block. Ensures cleanup."""
-        # Cleanly close the client and its connections.
-        if self._client:
+        # Cleanly close the client and its connections (unless shared).
+        if self._client and self._client is not self._shared_client:
             await self._client.aclose()
 
     async def _on_add_delivery_exception(
@@ -400,21 +413,25 @@ class Velide:
         """
         Helper to convert the strictly typed Snapshot data into a simple Status Map.
         """
-        snapshot_map: Dict[str, Tuple[str, Optional[str]]] = {}
-
         # 1. Process Unassigned Deliveries (Status: PENDING)
         # Pydantic ensures 'data.deliveries' is a list 
-        # (never None) due to default_factory
-        for item in data.deliveries:
-            # None indicates no deliveryman assigned
-            snapshot_map[item.id] = ("PENDING", None)
+        # (never None) due to default_factory.
+        # None indicates no deliveryman assigned (the tuple is shared, as
+        # it's immutable).
+        snapshot_map: Dict[str, Tuple[str, Optional[str]]] = dict.fromkeys(
+            (item.id for item in data.deliveries), ("PENDING", None)
+        )
 
         # 2. Process Assigned Deliveries (Status: ROUTED)
-        for dm in data.deliverymen:
-            if dm.route:
-                for item in dm.route.deliveries:
-                    # Store a tuple: (STATUS, DELIVERYMEN_EXTERNAL_ID)
-                    snapshot_map[item.id] = ("ROUTED", dm.id)
+        # Store a tuple: (STATUS, DELIVERYMEN_EXTERNAL_ID)
+        snapshot_map.update(
+            {
+                item.id: ("ROUTED", dm.id)
+                for dm in data.deliverymen
+                if dm.route
+                for item in dm.route.deliveries
+            }
+        )
 
         return snapshot_map
 
@@ -441,6 +458,7 @@ class Velide:
         response = await self._client.post(
             self._api_config.velide_server,
             json=payload.model_dump(mode="json", by_alias=True),
+            headers=self._request_headers,
         )
 
         if response.status_code != 200:
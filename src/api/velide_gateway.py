@@ -1,9 +1,14 @@
 # services/velide_gateway.py
+import asyncio
+import logging
 from threading import RLock
 from typing import Optional
 
+import httpx
+
 from api.velide import Velide
 from config import ApiConfig, ReconciliationConfig, TargetSystem
+from utils.background_loop import get_background_loop
 
 
 class VelideGateway:
@@ -12,13 +17,18 @@ class VelideGateway:
     
     This class acts as a Factory. Instead of holding a single shared 'Velide'
     instance (Singleton), it stores the necessary credentials (access token)
-    and configuration to manufacture a fresh, isolated 'Velide' client
-    for every request.
-    
-    This design is required for concurrent environments (like PyQt + asyncio)
-    where sharing an HTTP client across threads/loops causes RuntimeErrors.
+    and configuration to manufacture a fresh 'Velide' client for every request.
+
+    The clients share one pooled httpx.AsyncClient, so requests reuse open
+    connections instead of paying a new TCP/TLS handshake each time. An
+    AsyncClient is bound to the event loop that first uses it: it must only
+    be used from the shared background loop (see utils.background_loop),
+    as VelideWorker does.
     """
 
+    # How long close() waits for the HTTP client to close (seconds)
+    CLOSE_TIMEOUT = 2.0
+
     def __init__(
         self,
         api_config: ApiConfig,
@@ -38,6 +48,8 @@ class VelideGateway:
         self.config = api_config
         self.target = target_system
         self._reconciliation_config = reconciliation_config
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self.logger = logging.getLogger(__name__)
 
     def update_token(self, access_token: str) -> None:
         """
@@ -65,16 +77,46 @@ class VelideGateway:
                 return None
             
             # FACTORY PATTERN:
-            # We return a new instance every time. This ensures that the
-            # httpx.AsyncClient created inside 'Velide' belongs strictly
-            # to the thread/loop that requested it.
+            # We return a new instance every time, carrying the current token.
+            # Only the underlying HTTP connections are shared.
             return Velide(
                 self._access_token,
                 self.config,
                 self.target,
                 self._reconciliation_config,
+                http_client=self._get_http_client(),
             )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Returns the pooled HTTP client, creating it on first use."""
+        with self._lock:
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.config.timeout,
+                    verify=self.config.use_ssl,
+                )
+            return self._http_client
+
+    def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """
+        Closes the pooled HTTP client and its open connections, on the
+        background loop it's bound to. Waits up to 'timeout' seconds.
+        Clients issued afterwards get a new HTTP client.
+        """
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+        if http_client is None:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(
+            http_client.aclose(), get_background_loop()
+        )
+        try:
+            future.result(timeout)
+        except Exception:
+            self.logger.exception("Falha ao fechar o cliente HTTP do Velide.")
+
     def is_ready(self) -> bool:
         """
         Checks if the gateway has valid credentials to issue clients.
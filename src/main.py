@@ -113,9 +113,30 @@ def create_application() -> QApplication:
     app = QApplication(sys.argv)
     app.setStyleSheet(loadCSS())
     load_fonts()
+    configure_thread_pool()
     return app
 
 
+# Runnables holding a pool thread for the whole session: the CDS folder
+# listener and the websockets worker.
+LONG_LIVED_RUNNABLES = 2
+
+# Velide API calls in flight at once. Each one blocks a pool thread while
+# it waits for its result from the background event loop.
+CONCURRENT_VELIDE_REQUESTS = 2
+
+
+def configure_thread_pool():
+    """
+    Sizes the shared QThreadPool used by every worker: one thread per CPU
+    for short tasks, plus the threads held by long-lived runnables and by
+    in-flight Velide requests, so short tasks don't queue behind them.
+    """
+    QThreadPool.globalInstance().setMaxThreadCount(
+        (os.cpu_count() or 1) + LONG_LIVED_RUNNABLES + CONCURRENT_VELIDE_REQUESTS
+    )
+
+
 def configure_logging(view: MainView):
     """Sets up logging and connects the handler to the main view."""
     log_handler = QLogHandler(parent=view)
@@ -155,6 +176,9 @@ def setup_tray_icon(
         # Ensure cleanup happens before quitting
         tray.cleanup()
         services.websockets.stop_service()
+        services.gateway.close()
+        services.sqlite.drain_writes()
+        services.sqlite.close()
         app.quit()
         QThreadPool.globalInstance().waitForDone(1000)
         os._exit(0)
@@ -264,6 +288,7 @@ def build_services(app_config: Settings) -> Services:
         delivery_repository=delivery_repository,
         velide_action_handler=velide_action_handler,
         reconciliation=reconciliation_service,
+        gateway=velide_gateway,
     )
 
 def setup_strategy(
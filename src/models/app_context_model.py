@@ -6,6 +6,7 @@ from presenters.dashboard_presenter import DashboardPresenter
 from presenters.deliverymen_mapping_presenter import DeliverymenMappingPresenter
 from presenters.device_code_presenter import DeviceCodePresenter
 
+from api.velide_gateway import VelideGateway
 from repositories.deliveries_repository import DeliveryRepository
 from services.auth_service import AuthService
 from services.deliveries_service import DeliveriesService
@@ -36,4 +37,5 @@ class Services(BaseModel):
     websockets: VelideWebsocketsService
     velide_action_handler: VelideActionHandler
     reconciliation: ReconciliationService
+    gateway: VelideGateway
     # tracking_persistance: TrackingPersistenceService
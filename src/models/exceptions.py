@@ -35,6 +35,15 @@ class TokenPollingError(AuthorizationError):
         )
 
 
+class SessionExpiredError(AuthorizationError):
+    """
+    Raised when the session can no longer be renewed
+    and the user has to log in again.
+    """
+
+    pass
+
+
 class TokenStorageError(AuthorizationError):
     """Raised when the token cannot be accessed 
     (read/write/decode) on the file system."""
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 class DeliverymenMappingPresenter(QObject):
     mapping_done = pyqtSignal()
-    error = pyqtSignal(tuple)
+    error = pyqtSignal(str, str)
 
     def __init__(self, view: MainView, services: "Services", machine: MainStateMachine):
         super().__init__()
@@ -131,7 +131,12 @@ class DeliverymenMappingPresenter(QObject):
             headers=headers,
         )
         
-        # 6. Change view
+        # 6. Only allow cancelling when the user opened the screen manually
+        self._view.deliverymen_mapping_screen.set_cancel_visible(
+            mapping_workflow.is_manual_run
+        )
+
+        # 7. Change view
         self._view.deliverymen_mapping_screen.set_screen(1)
 
     def validate_mapping(self):
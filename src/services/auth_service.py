@@ -1,11 +1,14 @@
 from PyQt5.QtCore import QObject, pyqtSignal, QThreadPool, pyqtSlot, QTimer
 from config import AuthenticationConfig
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import jwt
 import time
 
-from workers.authorization_flow_worker import AuthorizationFlowWorker
+from workers.authorization_flow_worker import (
+    AuthorizationFlowSignals,
+    AuthorizationFlowWorker,
+)
 from workers.stored_token_retriever_worker import StoredTokenRetrieverWorker
 from workers.refresh_token_worker import RefreshTokenWorker
 
@@ -13,11 +16,17 @@ from api.velide_gateway import VelideGateway
 
 class AuthService(QObject):
     loading = pyqtSignal()
-    device_code = pyqtSignal(dict)
+    device_code = pyqtSignal(object)
     access_token = pyqtSignal(str)
     error = pyqtSignal(str, str)
     device_code_requested = pyqtSignal() 
 
+    # Title of the 'error' emitted when the token can't be refreshed anymore
+    SESSION_EXPIRED_TITLE = "Sessão expirada. Faça login novamente."
+
+    # A cached access token is only handed out if it lasts at least this long
+    CACHED_TOKEN_MIN_VALIDITY_SECONDS = 30
+
     def __init__(
         self, 
         auth_config: AuthenticationConfig, 
@@ -29,10 +38,19 @@ class AuthService(QObject):
         self._gateway = velide_gateway
 
         self._thread_pool = QThreadPool.globalInstance()
-        self._authorization_flow_worker = None
+        # Every flow that hasn't finished, keyed by its signals object.
+        # A flow outlives run() while it polls, and a flow started while
+        # another one requests its code relies on that one to poll.
+        self._authorization_flow_workers: Dict[
+            AuthorizationFlowSignals, AuthorizationFlowWorker
+        ] = {}
         self._stored_token_retriever_worker = None
         self._refresh_token_worker = None
 
+        # Last access token received and its 'exp' claim (if readable).
+        # Set as a single tuple, as it's read from other threads.
+        self._current_access_token: Optional[Tuple[str, Optional[int]]] = None
+
         # The Timer that will trigger the refresh automatically
         self._refresh_timer = QTimer(self)
         self._refresh_timer.setSingleShot(True)
@@ -46,12 +64,20 @@ class AuthService(QObject):
         """Creates and connects the authorization worker."""
         self.loading.emit()
         worker = AuthorizationFlowWorker(self._auth_config)
+        # Keep a reference until the flow finishes
+        self._authorization_flow_workers[worker.signals] = worker
+        worker.signals.finished.connect(self._on_authorization_flow_finished)
         worker.signals.device_code.connect(self.device_code)
         # Connect to internal handler, not directly to signal
         worker.signals.authenticated.connect(self._on_access_token_received)
         worker.signals.error.connect(self.error)
         self._thread_pool.start(worker)
 
+    @pyqtSlot()
+    def _on_authorization_flow_finished(self):
+        """Drops the reference to a flow once it's done."""
+        self._authorization_flow_workers.pop(self.sender(), None)
+
     @pyqtSlot()
     def load_stored_token(self):
         """Creates and connects the token retriever worker."""
@@ -65,6 +91,26 @@ class AuthService(QObject):
         )
         self._thread_pool.start(worker)
 
+    def get_cached_access_token(self) -> Optional[str]:
+        """
+        Returns the last access token received, without any round-trip,
+        if it's still valid for at least CACHED_TOKEN_MIN_VALIDITY_SECONDS.
+        Tokens are kept fresh by the refresh timer. Safe to call from any thread.
+
+        Returns:
+            The access token, or None if there's no token known to be valid.
+        """
+        current = self._current_access_token
+        if current is None:
+            return None
+
+        access_token, exp_timestamp = current
+        if exp_timestamp is None:
+            return None
+        if exp_timestamp - time.time() < self.CACHED_TOKEN_MIN_VALIDITY_SECONDS:
+            return None
+        return access_token
+
     # --- Internal Logic & The "Loop" ---
 
     def _on_access_token_received(
@@ -85,40 +131,44 @@ class AuthService(QObject):
             self._current_refresh_token = refresh_token
 
         # 3. Schedule the NEXT refresh automatically
-        self._schedule_next_refresh(access_token)
+        exp_timestamp = self._decode_exp(access_token)
+        self._current_access_token = (access_token, exp_timestamp)
+        self._schedule_next_refresh(exp_timestamp)
 
         # 4. Notify the Application (FSM)
         # This keeps the FSM in "LoggedInState" (or transitions it there)
         self.access_token.emit(access_token)
 
-    def _schedule_next_refresh(self, access_token: str):
-        """Decodes JWT and sets the timer."""
+    @staticmethod
+    def _decode_exp(access_token: str) -> Optional[int]:
+        """Reads the JWT 'exp' claim, or None if missing or unreadable."""
         try:
             # Decode without verification (we just want the 'exp' claim)
             decoded = jwt.decode(access_token, options={"verify_signature": False})
-            exp_timestamp = decoded.get("exp")
-
-            if not exp_timestamp:
-                return 
-
-            current_time = time.time()
-            buffer_seconds = 60  # Refresh 1 minute before actual death
-            
-            seconds_until_refresh = exp_timestamp - current_time - buffer_seconds
-
-            if seconds_until_refresh <= 0:
-                # Edge case: Token expired while app was sleeping, or close to it.
-                # Refresh immediately.
-                self._on_refresh_timer_triggered()
-            else:
-                # Convert to milliseconds for QTimer
-                ms_until_refresh = int(seconds_until_refresh * 1000)
-                self._refresh_timer.start(ms_until_refresh)
-
         except jwt.DecodeError:
+            return None
+        return decoded.get("exp") or None
+
+    def _schedule_next_refresh(self, exp_timestamp: Optional[int]):
+        """Sets the timer to refresh the token before 'exp_timestamp'."""
+        if not exp_timestamp:
             # If we can't read the token, we can't auto-refresh. 
             # We just wait for the inevitable 401 error in the workers.
-            pass
+            return 
+
+        current_time = time.time()
+        buffer_seconds = 60  # Refresh 1 minute before actual death
+        
+        seconds_until_refresh = exp_timestamp - current_time - buffer_seconds
+
+        if seconds_until_refresh <= 0:
+            # Edge case: Token expired while app was sleeping, or close to it.
+            # Refresh immediately.
+            self._on_refresh_timer_triggered()
+        else:
+            # Convert to milliseconds for QTimer
+            ms_until_refresh = int(seconds_until_refresh * 1000)
+            self._refresh_timer.start(ms_until_refresh)
 
     def _on_refresh_timer_triggered(self):
         """Called automatically by QTimer when time is up."""
@@ -142,6 +192,6 @@ class AuthService(QObject):
         # TODO: 'error' signal is unused. Fix it.
         worker.signals.error.connect(
             # If refresh fails, we might need to logout.
-            lambda msg: self.error.emit("Sessão expirada. Faça login novamente.", msg)
+            lambda msg: self.error.emit(self.SESSION_EXPIRED_TITLE, msg)
         )
         self._thread_pool.start(worker)
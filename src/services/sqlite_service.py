@@ -1,9 +1,18 @@
 import logging
-from typing import Any, List, Optional, Tuple
+import threading
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Any, Callable, Deque, List, Optional, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSignal, QThreadPool, pyqtSlot
+from PyQt5.QtCore import QObject, pyqtSignal, QThreadPool, QTimer, pyqtSlot
 
-from workers.sqlite_worker import SQLiteWorker, SQLiteWorkerSignals
+from api.sqlite_manager import SQLiteManager
+from api.sqlite_pool import close_pool
+from workers.sqlite_worker import (
+    SQLiteWorker,
+    SQLiteWorkerSignals,
+    SQLiteWorkerSignalsPool,
+)
 
 
 class SQLiteService(QObject):
@@ -37,12 +46,14 @@ class SQLiteService(QObject):
     # Emits a list of all mappings
     all_mappings_found = pyqtSignal(list)
 
-    # Emits error info (tuple from sys.exc_info()) if any worker fails
-    error_occurred = pyqtSignal(tuple)
+    # Emits the exception type name and message if any worker fails
+    error_occurred = pyqtSignal(str, str)
 
     # --- Delivery Service-Level Signals ---
 
-    # Emits True/False on completion of adding a delivery
+    # Emits True/False on completion of adding a delivery.
+    # Adds are written in batches: emitted once per batch, True only if
+    # every delivery in it was inserted.
     add_delivery_result = pyqtSignal(bool)
 
     # Emits the number of rows successfully inserted (int)
@@ -62,6 +73,17 @@ class SQLiteService(QObject):
 
     prune_result = pyqtSignal(int)
 
+    # Single delivery adds arriving within this window (ms) share a transaction
+    ADD_DELIVERY_BATCH_WINDOW_MS = 50
+    # A batch is written right away once it reaches this size
+    ADD_DELIVERY_BATCH_MAX_SIZE = 200
+
+    # How long drain_writes() waits for the write already running (seconds)
+    DRAIN_RUNNING_TIMEOUT = 5.0
+
+    # Deliverymen ID lookups remembered per direction
+    ID_CACHE_MAX_SIZE = 10_000
+
     def __init__(self, db_path: str, parent: Optional[QObject] = None):
         """
         Initializes the database service.
@@ -74,8 +96,39 @@ class SQLiteService(QObject):
         self.db_path = db_path
         self.thread_pool = QThreadPool.globalInstance()
         self.logger = logging.getLogger(__name__)
-
-    def _create_and_run_worker(self, factory_method, *args, result_signal: Any):
+        self._signals_pool = SQLiteWorkerSignalsPool()
+
+        # Open the database and its connections now, not on the first task
+        SQLiteManager(db_path).warm_up()
+
+        # Delivery mappings waiting to be written as one batch
+        self._pending_delivery_mappings: Deque[Tuple[str, str, object]] = deque()
+        self._delivery_batch_timer = QTimer(self)
+        self._delivery_batch_timer.setSingleShot(True)
+        self._delivery_batch_timer.setInterval(self.ADD_DELIVERY_BATCH_WINDOW_MS)
+        self._delivery_batch_timer.timeout.connect(self.flush_pending_writes)
+
+        # Writes run one at a time, in the order they were requested, so
+        # e.g. a status update never runs before the add it follows.
+        # Reads requested while writes are queued or running wait behind them.
+        self._queued_workers: Deque[SQLiteWorker] = deque()
+        self._running_queued_signals: Optional[SQLiteWorkerSignals] = None
+        self._running_queued_done: Optional[threading.Event] = None
+
+        # Deliverymen mapping lookups already answered by the database.
+        # Any mapping write clears them and bumps the generation, so a
+        # lookup that was in flight during a write isn't cached.
+        self._local_id_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._velide_id_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._mappings_generation = 0
+
+    def _create_and_run_worker(
+        self,
+        factory_method,
+        *args,
+        result_signal: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+    ):
         """
         Internal helper method to create, connect, and run a worker.
 
@@ -83,9 +136,14 @@ class SQLiteService(QObject):
             factory_method: The SQLiteWorker classmethod (e.g., for_add_mapping).
             *args: Arguments for the factory method (e.g., velide_id).
             result_signal: The service-level signal to emit the result to.
+            on_result: Optional callback run with the result before it is
+                       emitted through 'result_signal'.
         """
-        # 1. Create the worker-specific signals
-        worker_signals = SQLiteWorkerSignals()
+        # Batched adds are queued first, so this operation sees (or updates) them
+        self.flush_pending_writes()
+
+        # 1. Get the worker-specific signals (reused between tasks)
+        worker_signals = self._signals_pool.acquire()
 
         # 2. Create the worker using its factory
         worker = factory_method(worker_signals, self.db_path, *args)
@@ -93,18 +151,80 @@ class SQLiteService(QObject):
         # 3. Connect the worker's signals to our service's signals
         #    - Connect the worker's 'result' to the specific service signal
         #    - Connect the worker's 'error' to the specific error signal
+        if on_result is not None:
+            worker.signals.result.connect(on_result)
         worker.signals.result.connect(result_signal.emit)
         worker.signals.error.connect(self.error_occurred.emit)
+        worker.signals.finished.connect(self._on_worker_finished)
 
         # 4. Start the worker in the global thread pool
+        self._submit(worker)
+
+    def _submit(self, worker: SQLiteWorker):
+        """
+        Starts a worker in the global thread pool. Writes, and reads that
+        follow a pending write, go through the serial queue instead.
+        """
+        if worker.read_only and self._running_queued_signals is None:
+            self.thread_pool.start(worker)
+            return
+
+        self._queued_workers.append(worker)
+        if self._running_queued_signals is None:
+            self._start_next_queued()
+
+    def _start_next_queued(self):
+        """Starts the next queued worker, if any."""
+        if not self._queued_workers:
+            self._running_queued_signals = None
+            self._running_queued_done = None
+            return
+        worker = self._queued_workers.popleft()
+        self._running_queued_signals = worker.signals
+        self._running_queued_done = worker.done
         self.thread_pool.start(worker)
 
+    def drain_writes(self, timeout: float = DRAIN_RUNNING_TIMEOUT):
+        """
+        Writes everything still buffered or queued before the app exits,
+        blocking the calling (GUI) thread.
+
+        Queued workers are normally started from the 'finished' slot, which
+        won't run once the event loop has stopped, so the remaining ones
+        run inline here, after the one already running.
+
+        Args:
+            timeout: Seconds to wait for the write that is already running.
+        """
+        self.flush_pending_writes()
+
+        if self._running_queued_done is not None:
+            if not self._running_queued_done.wait(timeout):
+                self.logger.warning(
+                    "Escrita em andamento não terminou a tempo; "
+                    "executando as pendentes mesmo assim."
+                )
+
+        # The slot must not start the next queued worker in the pool
+        self._running_queued_signals = None
+        self._running_queued_done = None
+        while self._queued_workers:
+            self._queued_workers.popleft().run()
+
+    def close(self):
+        """
+        Closes the database connections. Call it last on shutdown, after
+        drain_writes(): no task may be started once it's closed.
+        """
+        close_pool(self.db_path)
+
     @pyqtSlot(str, str)
     def request_add_mapping(self, velide_id: str, local_id: str):
         """Asynchronously adds a new mapping."""
         self.logger.debug(
             f"Solicitando para adicionar mapeamento: {velide_id} -> {local_id}"
         )
+        self._invalidate_id_caches()
         self._create_and_run_worker(
             SQLiteWorker.for_add_mapping,
             velide_id,
@@ -118,6 +238,7 @@ class SQLiteService(QObject):
         self.logger.debug(
             f"Solicitando {len(mappings)} mapeamentos para serem adicionados."
         )
+        self._invalidate_id_caches()
         self._create_and_run_worker(
             SQLiteWorker.for_add_many_mappings,
             mappings,  # Note: 'mappings' is a single list argument, matching *args
@@ -126,24 +247,87 @@ class SQLiteService(QObject):
 
     @pyqtSlot(str)
     def request_get_local_id(self, velide_id: str):
-        """Asynchronously retrieves a local_id."""
+        """
+        Asynchronously retrieves a local_id.
+        Known IDs are answered from memory, without a database task.
+        """
         self.logger.debug(f"Solicitando `local_id` para: {velide_id}")
+        cached = self._get_cached_id(self._local_id_cache, velide_id)
+        if cached is not None:
+            # Still emitted asynchronously, like a database result
+            QTimer.singleShot(0, partial(self.local_id_found.emit, cached))
+            return
+
         self._create_and_run_worker(
-            SQLiteWorker.for_get_local_id, velide_id, result_signal=self.local_id_found
+            SQLiteWorker.for_get_local_id,
+            velide_id,
+            result_signal=self.local_id_found,
+            on_result=partial(
+                self._cache_id,
+                self._local_id_cache,
+                velide_id,
+                self._mappings_generation,
+            ),
         )
 
     @pyqtSlot(str)
     def request_get_velide_id(self, local_id: str):
-        """Asynchronously retrieves a velide_id."""
+        """
+        Asynchronously retrieves a velide_id.
+        Known IDs are answered from memory, without a database task.
+        """
         self.logger.debug(f"Solicitando `velide_id` para: {local_id}")
+        cached = self._get_cached_id(self._velide_id_cache, local_id)
+        if cached is not None:
+            # Still emitted asynchronously, like a database result
+            QTimer.singleShot(0, partial(self.velide_id_found.emit, cached))
+            return
+
         self._create_and_run_worker(
-            SQLiteWorker.for_get_velide_id, local_id, result_signal=self.velide_id_found
+            SQLiteWorker.for_get_velide_id,
+            local_id,
+            result_signal=self.velide_id_found,
+            on_result=partial(
+                self._cache_id,
+                self._velide_id_cache,
+                local_id,
+                self._mappings_generation,
+            ),
         )
 
+    def _get_cached_id(self, cache: "OrderedDict[str, str]", key: str) -> Optional[str]:
+        """Returns a cached ID, marking it as recently used."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_id(
+        self,
+        cache: "OrderedDict[str, str]",
+        key: str,
+        generation: int,
+        value: Optional[str],
+    ):
+        """Remembers a lookup result, unless a mapping write happened since."""
+        if value is None or generation != self._mappings_generation:
+            return
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.ID_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+    def _invalidate_id_caches(self):
+        """Forgets all cached ID lookups (called on every mapping write)."""
+        self._mappings_generation += 1
+        self._local_id_cache.clear()
+        self._velide_id_cache.clear()
+
     @pyqtSlot(str)
     def request_delete_mapping(self, velide_id: str):
         """Asynchronously deletes a mapping."""
         self.logger.debug(f"Solicitando para deletar mapeamento de: {velide_id}")
+        self._invalidate_id_caches()
         self._create_and_run_worker(
             SQLiteWorker.for_delete_mapping,
             velide_id,
@@ -164,17 +348,57 @@ class SQLiteService(QObject):
 
     @pyqtSlot(str, str, object)  # 'object' allows passing the Enum
     def request_add_delivery_mapping(self, external_id: str, internal_id: str, status):
-        """Asynchronously adds a new delivery mapping."""
+        """
+        Asynchronously adds a new delivery mapping.
+
+        Adds are buffered for up to ADD_DELIVERY_BATCH_WINDOW_MS and written
+        together in a single transaction.
+        """
         self.logger.debug(
             f"Solicitando adicionar entrega: {external_id} -> {internal_id} ({status})"
         )
-        self._create_and_run_worker(
-            SQLiteWorker.for_add_delivery_mapping,
-            external_id,
-            internal_id,
-            status,
-            result_signal=self.add_delivery_result,
+        self._pending_delivery_mappings.append((external_id, internal_id, status))
+
+        if len(self._pending_delivery_mappings) >= self.ADD_DELIVERY_BATCH_MAX_SIZE:
+            self.flush_pending_writes()
+        elif not self._delivery_batch_timer.isActive():
+            self._delivery_batch_timer.start()
+
+    @pyqtSlot()
+    def flush_pending_writes(self):
+        """Writes the buffered delivery mappings now, as a single batch."""
+        self._delivery_batch_timer.stop()
+        if not self._pending_delivery_mappings:
+            return
+
+        batch = list(self._pending_delivery_mappings)
+        self._pending_delivery_mappings.clear()
+
+        worker_signals = self._signals_pool.acquire()
+        worker = SQLiteWorker.for_add_many_delivery_mappings(
+            worker_signals, self.db_path, batch
+        )
+        worker.signals.result.connect(
+            partial(self._on_delivery_batch_added, len(batch))
         )
+        worker.signals.error.connect(self.error_occurred.emit)
+        worker.signals.finished.connect(self._on_worker_finished)
+        self._submit(worker)
+
+    @pyqtSlot()
+    def _on_worker_finished(self):
+        """
+        Hands the finished worker's signals back to the pool and, if it
+        was the queued one, starts the next queued worker.
+        """
+        signals = self.sender()
+        self._signals_pool.release(signals)
+        if signals is self._running_queued_signals:
+            self._start_next_queued()
+
+    def _on_delivery_batch_added(self, batch_size: int, inserted_count: int):
+        """Reports a batch of single adds as one add_delivery_result."""
+        self.add_delivery_result.emit(inserted_count == batch_size)
 
     @pyqtSlot(list)
     def request_add_many_delivery_mappings(
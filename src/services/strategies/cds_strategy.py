@@ -1,6 +1,7 @@
 # In a new file, e.g., src/services/delivery_service.py
 import logging
-from typing import Optional
+from typing import List, Optional
+import time
 import uuid
 from PyQt5.QtCore import QThreadPool
 from pydantic import ValidationError
@@ -9,6 +10,7 @@ from models.cds_order_model import CdsOrder
 from services.strategies.connectable_strategy import IConnectableStrategy
 from config import ApiConfig
 from workers.cds_logs_listener_worker import CdsLogsListenerWorker
+from utils.cds_checkpoint import CDS_CHECKPOINT_PATH
 
 
 class CdsStrategy(IConnectableStrategy):
@@ -21,16 +23,28 @@ class CdsStrategy(IConnectableStrategy):
         # These workers will be created and moved to threads later
         self._file_listener_worker = None
         self._thread_pool = QThreadPool.globalInstance()
+        # Orders written from this moment on must not be missed, even if
+        # the listener only starts later (e.g. after the user logs in).
+        # Only used until the first order is processed: from then on, the
+        # listener resumes from its saved checkpoint.
+        self._not_listening_since = time.time()
 
     def start_listening(self):
         """Creates and starts the file listener worker in a background thread."""
-        self._file_listener_worker = CdsLogsListenerWorker(self._folder_to_watch)
-        self._file_listener_worker.signals.new_order.connect(self._on_new_file_found)
+        self._file_listener_worker = CdsLogsListenerWorker(
+            self._folder_to_watch,
+            process_files_since=self._not_listening_since,
+            checkpoint_path=CDS_CHECKPOINT_PATH,
+        )
+        self._file_listener_worker.signals.new_order.connect(
+            self._on_new_files_found
+        )
         self._thread_pool.start(self._file_listener_worker)
 
     def stop_listening(self):
         if self._file_listener_worker is None:
             return
+        self._not_listening_since = time.time()
         self._file_listener_worker.stop()
 
     def fetch_deliverymen(self, success, error):
@@ -42,6 +56,10 @@ class CdsStrategy(IConnectableStrategy):
     def on_delivery_failed(self, internal_id: Optional[float]):
         return  # Just ignore it.
 
+    def _on_new_files_found(self, deliveries_data: List[dict]):
+        for delivery_data in deliveries_data:
+            self._on_new_file_found(delivery_data)
+
     def _on_new_file_found(self, delivery_data: dict):
         try:
             cds_order: CdsOrder = CdsOrder.model_validate(delivery_data)
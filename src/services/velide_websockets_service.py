@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from PyQt5.QtCore import QObject, pyqtSignal, QThreadPool
 
@@ -62,7 +62,7 @@ class VelideWebsocketsService(QObject):
         self._worker = VelideWebsocketsWorker(self.api_config, self.auth_service)
         
         # Connect Data & Lifecycle Signals
-        self._worker.signals.action_received.connect(self.action_received.emit)
+        self._worker.signals.actions_received.connect(self._on_actions_received)
         self._worker.signals.finished.connect(self._on_worker_finished)
         
         # Connect Status & Error Signals
@@ -84,6 +84,14 @@ class VelideWebsocketsService(QObject):
         else:
             self.logger.debug("Stop chamado, mas nenhum worker está ativo.")
 
+    def _on_actions_received(self, actions: List[LatestAction]):
+        """
+        Unpacks a batch of actions from the worker, which coalesces bursts
+        into a single cross-thread signal, emitting them one by one.
+        """
+        for action in actions:
+            self.action_received.emit(action)
+
     def _dispatch_status_signal(self, state: ConnectionState):
         """
         Translates internal ConnectionState enum to specific FSM signals.
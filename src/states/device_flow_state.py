@@ -2,7 +2,7 @@ from __future__ import annotations
 from PyQt5.QtCore import QState, pyqtSignal
 
 from typing import TYPE_CHECKING
-from utils.device_code import DeviceCodeDict
+from utils.device_code import DeviceCodeInfo
 
 if TYPE_CHECKING:
     from models.app_context_model import Services
@@ -34,6 +34,6 @@ class DeviceFlowState(QState):
         )
         # TODO: Expired or error
 
-    def _on_device_code_received(self, code_data: DeviceCodeDict):
+    def _on_device_code_received(self, code_data: DeviceCodeInfo):
         self.waiting_for_login.setProperty("device_code", code_data)
         self._device_code_stored.emit()
@@ -1,7 +1,9 @@
-from typing import TypedDict, cast
-import requests
+from enum import Enum
+from typing import Dict, Optional, TypedDict, Union, cast
+from urllib.parse import urlencode
 import json
 from requests.exceptions import RequestException, HTTPError
+from utils.oauth_session import OAUTH_TIMEOUT, oauth_polling_session
 from models.exceptions import NetworkError, ApiError, TokenPollingError
 
 
@@ -15,6 +17,34 @@ class AccessTokenDict(TypedDict, total=False):
     id_token: str
 
 
+class TokenPollingState(str, Enum):
+    """
+    Expected OAuth responses while the user has not finished the device flow.
+    Returned (not raised) by AccessToken.try_request, since they are the
+    common case of every polling tick.
+    """
+
+    PENDING = "authorization_pending"
+    SLOW_DOWN = "slow_down"
+    DENIED = "access_denied"
+    EXPIRED = "expired_token"
+
+
+_POLLING_STATES: Dict[str, TokenPollingState] = {
+    state.value: state for state in TokenPollingState
+}
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a 'Retry-After' header given in seconds (HTTP dates are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 class AccessToken:
     def __init__(self, domain: str, client_id: str, device_code: str):
         self.url = f"https://{domain}/oauth/token"
@@ -24,18 +54,31 @@ class AccessToken:
             "client_id": client_id,
             "device_code": device_code,
         }
+        # The body is the same on every poll, so it is form-encoded only once.
+        self._body = urlencode(self.data).encode("ascii")
+        # Seconds the server asked us to wait ('Retry-After') on the last request.
+        self.retry_after: Optional[float] = None
 
-    def request(self) -> AccessTokenDict:
+    def try_request(self) -> Union[TokenPollingState, AccessTokenDict]:
         """
-        Polls the token endpoint for an access token.
+        Polls the token endpoint for an access token without raising on
+        the expected OAuth polling responses.
         - On success: returns the strictly typed token dictionary.
-        - On failure: raises NetworkError, ApiError, or TokenPollingError.
+        - On a known polling response: returns its TokenPollingState.
+        - On failure: raises NetworkError, ApiError, or TokenPollingError
+          (the latter only for unknown OAuth error codes).
         """
         try:
-            response = requests.post(
-                self.url, headers=self.headers, data=self.data, verify=False, timeout=10
+            response = oauth_polling_session.post(
+                self.url,
+                headers=self.headers,
+                data=self._body,
+                verify=True,
+                timeout=OAUTH_TIMEOUT,
             )
 
+            self.retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
             # Check the response content first
             response_data = response.json()
 
@@ -44,7 +87,11 @@ class AccessToken:
             if "error" in response_data:
                 error_code = response_data.get("error")
                 # These are expected polling responses ("authorization_pending", etc.)
-                # We raise a specific error so the caller can handle them.
+                # We return them as plain values so the caller can branch on them.
+                state = _POLLING_STATES.get(error_code)
+                if state is not None:
+                    return state
+                # Unknown OAuth errors are still raised.
                 raise TokenPollingError(
                     error_code=error_code,
                     error_description=response_data.get("error_description", ""),
@@ -32,6 +32,7 @@ async def execute_with_retry(
     exceptions: Tuple[Type[Exception], ...] = (httpx.RequestError, httpx.TimeoutException),
     on_exception: Optional[ExceptionCallback[T]] = None,
     logger: Optional[Any] = None,
+    sleep: Optional[Callable[[float], Awaitable[Any]]] = None,
     **kwargs: Any
 ) -> T:
     """Executes an async coroutine function with exponential backoff retry logic.
@@ -46,6 +47,8 @@ async def execute_with_retry(
         exceptions: A tuple of exception classes that should trigger a retry.
         on_exception: An optional sync/async callback function called on exception.
         logger: An optional logger instance.
+        sleep: The coroutine function used to wait between attempts.
+            Defaults to `asyncio.sleep`; tests can pass a no-op instead.
         **kwargs: Keyword arguments to pass to `coro_fn`.
 
     Returns:
@@ -57,6 +60,9 @@ async def execute_with_retry(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    if sleep is None:
+        sleep = asyncio.sleep
+
     for attempt in range(1, max_retries + 1):
         try:
             return await coro_fn(*args, **kwargs)
@@ -93,7 +99,7 @@ async def execute_with_retry(
                 f"{friendly_error}. Aguardando {delay}s..."
             )
 
-            await asyncio.sleep(delay)
+            await sleep(delay)
             delay *= backoff_factor
 
     # Final failure log before raising
@@ -111,6 +117,7 @@ def async_retry(
     backoff_factor: float = 2.0,
     exceptions: Tuple[Type[Exception], ...] = (httpx.RequestError, httpx.TimeoutException),
     on_exception: Optional[ExceptionCallback[Any]] = None,
+    sleep: Optional[Callable[[float], Awaitable[Any]]] = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
     """A decorator wrapper to easily apply exponential retry logic to async functions."""
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
@@ -131,6 +138,7 @@ def async_retry(
                 exceptions=exceptions,
                 on_exception=on_exception,
                 logger=logger,
+                sleep=sleep,
                 **kwargs
             )
 
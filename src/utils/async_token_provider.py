@@ -3,6 +3,7 @@ import logging
 
 from PyQt5.QtCore import QObject, pyqtSlot, Qt, QTimer
 
+from models.exceptions import SessionExpiredError
 from services.auth_service import AuthService
 
 class AsyncTokenProvider:
@@ -54,9 +55,11 @@ class AsyncTokenProvider:
             """
             if not self._future.done():
                 error_msg = f"Auth Failure [{title}]: {msg}"
-                self._loop.call_soon_threadsafe(
-                    self._future.set_exception, RuntimeError(error_msg)
-                )
+                if title == AuthService.SESSION_EXPIRED_TITLE:
+                    error: Exception = SessionExpiredError(error_msg)
+                else:
+                    error = RuntimeError(error_msg)
+                self._loop.call_soon_threadsafe(self._future.set_exception, error)
 
     @classmethod
     async def get_valid_token(
@@ -65,7 +68,8 @@ class AsyncTokenProvider:
         timeout: float = 10.0
     ) -> str:
         """
-        Triggers token retrieval on the Main Thread and 
+        Returns the token the service already holds, if still valid.
+        Otherwise, triggers token retrieval on the Main Thread and 
         awaits the result asynchronously.
 
         Args:
@@ -78,8 +82,14 @@ class AsyncTokenProvider:
 
         Raises:
             asyncio.TimeoutError: If the service does not respond within the timeout.
-            RuntimeError: If the service emits an error signal or fails invocation.
+            SessionExpiredError: If the token can't be refreshed anymore.
+            RuntimeError: If the service emits another error or fails invocation.
         """
+        # Fast path: the service keeps its token refreshed ahead of expiry
+        cached_token = auth_service.get_cached_access_token()
+        if cached_token is not None:
+            return cached_token
+
         loop = asyncio.get_running_loop()
         future = loop.create_future()
 
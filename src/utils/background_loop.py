@@ -0,0 +1,39 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional
+
+# This file holds a single asyncio event loop shared by the async workers,
+# so they don't build and tear down a new loop on every run.
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the process-wide event loop, starting its thread on first use.
+
+    The loop is created lazily so the event loop policy set by
+    apply_asyncio_fix() at startup is the one used.
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="BackgroundEventLoop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_in_background_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Runs a coroutine on the background loop and blocks the calling thread
+    until it completes, returning its result or raising its exception.
+
+    Must not be called from the background loop's own thread.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    return future.result()
@@ -0,0 +1,44 @@
+import os
+import logging
+from typing import Optional
+from utils.bundle_dir import BUNDLE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Modification time (ns) of the newest CDS order file already processed
+CDS_CHECKPOINT_PATH = os.path.join(BUNDLE_DIR, "resources", "cds_checkpoint.txt")
+
+
+def read_cds_checkpoint(file_path: str = CDS_CHECKPOINT_PATH) -> Optional[int]:
+    """
+    Reads the modification time (in ns) of the newest processed order file.
+
+    Returns:
+        The saved mtime, or None if nothing was saved yet or the file
+        can't be read.
+    """
+    try:
+        with open(file_path, "r") as file:
+            return int(file.read().strip())
+    except FileNotFoundError:
+        # Expected before the first order is processed
+        return None
+    except (OSError, ValueError):
+        logger.exception(f"Falha ao ler o marcador de pedidos: {file_path}")
+        return None
+
+
+def store_cds_checkpoint(mtime_ns: int, file_path: str = CDS_CHECKPOINT_PATH):
+    """
+    Saves the modification time (in ns) of the newest processed order file.
+    Failures are logged: at worst, the next startup scans from an older mark.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Replaced in one step, so a crash never leaves a truncated mark
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w") as file:
+            file.write(str(mtime_ns))
+        os.replace(temp_path, file_path)
+    except OSError:
+        logger.exception(f"Falha ao salvar o marcador de pedidos: {file_path}")
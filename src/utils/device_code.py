@@ -1,6 +1,9 @@
+from dataclasses import dataclass
 from typing import TypedDict, cast
+from urllib.parse import urlencode
 import requests
 import json
+from utils.oauth_session import OAUTH_TIMEOUT, oauth_session
 from models.exceptions import ApiError, NetworkError
 
 
@@ -13,29 +16,71 @@ class DeviceCodeDict(TypedDict):
     verification_uri_complete: str
 
 
+@dataclass(frozen=True)
+class DeviceCodeInfo:
+    """
+    The device code response, parsed once.
+    Passed as-is through signals and read by attribute while polling.
+    """
+
+    __slots__ = (
+        "device_code",
+        "user_code",
+        "verification_uri",
+        "verification_uri_complete",
+        "expires_in",
+        "interval",
+    )
+
+    device_code: str
+    user_code: str
+    verification_uri: str
+    verification_uri_complete: str
+    expires_in: int
+    interval: int
+
+    @classmethod
+    def from_response(cls, data: DeviceCodeDict) -> "DeviceCodeInfo":
+        return cls(
+            device_code=data["device_code"],
+            user_code=data["user_code"],
+            verification_uri=data["verification_uri"],
+            verification_uri_complete=data["verification_uri_complete"],
+            expires_in=data["expires_in"],
+            interval=data["interval"],
+        )
+
+
 class DeviceCode:
     def __init__(self, domain: str, client_id: str, scope: str, audience: str):
         # Added type hints to init arguments for completeness
         self.url = "https://{_domain}/oauth/device/code".format(_domain=domain)
         self.headers = {"Content-Type": "application/x-www-form-urlencoded"}
         self.data = {"client_id": client_id, "scope": scope, "audience": audience}
+        self._body = urlencode(self.data).encode("ascii")
 
-    def request(self) -> DeviceCodeDict:
+    def request(self) -> DeviceCodeInfo:
         """
         Performs the device code request.
-        Returns the response JSON on success.
+        Returns the parsed response on success.
         Raises NetworkError or ApiError on failure.
         """
         try:
-            response = requests.post(
-                self.url, headers=self.headers, data=self.data, verify=False, timeout=15
+            response = oauth_session.post(
+                self.url,
+                headers=self.headers,
+                data=self._body,
+                verify=True,
+                timeout=OAUTH_TIMEOUT,
             )
 
             # Raise an exception for bad status codes (4xx or 5xx)
             response.raise_for_status()
 
             # FIX: Explicitly cast the generic JSON result to your specific TypedDict
-            return cast(DeviceCodeDict, response.json())
+            return DeviceCodeInfo.from_response(
+                cast(DeviceCodeDict, response.json())
+            )
 
         except requests.HTTPError as e:
             # FIX: Catch HTTPError BEFORE RequestException, 
@@ -0,0 +1,58 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connect and read timeouts (in seconds) for requests to the
+# authorization server.
+OAUTH_TIMEOUT = (3.05, 15)
+
+
+def _create_session(
+    status_forcelist,
+    respect_retry_after_header: bool = True,
+    retry_reads: bool = True,
+) -> requests.Session:
+    """
+    Creates a session whose failed requests on the given statuses are
+    retried with exponential backoff and jitter, optionally honoring the
+    server's 'Retry-After' header.
+
+    Note that urllib3 honoring 'Retry-After' also retries 413/429/503
+    responses carrying it, even if they aren't in 'status_forcelist'.
+
+    With 'retry_reads' off, a request is not sent again once it reached
+    the server and the response failed to arrive (it may have been
+    processed already).
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.5,
+                backoff_jitter=1.0,
+                status_forcelist=status_forcelist,
+                read=None if retry_reads else 0,
+                respect_retry_after_header=respect_retry_after_header,
+                allowed_methods=frozenset(["POST"]),
+            )
+        ),
+    )
+    return session
+
+
+# Used by the device code request. Transient failures (429/5xx) are retried.
+oauth_session = _create_session((429, 500, 502, 503, 504))
+
+# Used by the access token polling, so its connection is reused across
+# polls. 429 is never retried here: it's how the server says 'slow_down',
+# and the polling worker backs off on it (reading 'Retry-After' itself).
+oauth_polling_session = _create_session(
+    (500, 502, 503, 504), respect_retry_after_header=False
+)
+
+# Used by the token refresh. Refresh tokens may be rotated on use, so a
+# refresh is only sent again when the server surely didn't process it:
+# connection failures and 429/503, never after a read error.
+oauth_refresh_session = _create_session((429, 503), retry_reads=False)
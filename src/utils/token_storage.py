@@ -2,11 +2,17 @@ import os
 import json
 import base64
 import binascii
-from typing import Optional
+import threading
+from typing import Optional, Tuple
 from utils.access_token import AccessTokenDict
 from utils.bundle_dir import BUNDLE_DIR
 from models.exceptions import TokenStorageError
 
+# Last token read, keyed by the file's (inode, mtime, size) at read time.
+# Lets repeated reads skip opening and decoding an unchanged file.
+_cached_token: Optional[Tuple[Tuple[int, int, int], dict]] = None
+_cache_lock = threading.Lock()
+
 # --- HELPER FUNCTIONS ---
 
 
@@ -33,6 +39,18 @@ def _decode_string_base64(encoded_string: str) -> str:
         ) from e
 
 
+def _set_cached_token(key: Tuple[int, int, int], token: dict):
+    global _cached_token
+    with _cache_lock:
+        _cached_token = (key, token)
+
+
+def _clear_cached_token():
+    global _cached_token
+    with _cache_lock:
+        _cached_token = None
+
+
 # --- TOKEN STORAGE FUNCTIONS ---
 
 
@@ -54,6 +72,8 @@ def store_token_at_file(token: AccessTokenDict):
         with open(file_path, "w") as file:
             file.write(encoded_token)
 
+        _clear_cached_token()
+
     except (IOError, OSError) as e:
         # Catch file system errors (e.g., permissions, disk full)
         raise TokenStorageError(original_exception=e) from e
@@ -67,6 +87,7 @@ def store_token_at_file(token: AccessTokenDict):
 def read_token_from_file() -> Optional[dict]:
     """
     Reads, decodes, and returns the token dictionary from a file.
+    While the file is unchanged, the previously decoded token is reused.
 
     Returns:
         A dictionary containing the token if found and successfully decoded.
@@ -78,6 +99,16 @@ def read_token_from_file() -> Optional[dict]:
     file_path = os.path.join(BUNDLE_DIR, "resources", "token.txt")
 
     try:
+        # Stat before reading: if the file changes in between, the key
+        # won't match next time and the file is simply read again.
+        stat = os.stat(file_path)
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with _cache_lock:
+            cached = _cached_token
+        if cached is not None and cached[0] == key:
+            # Copied, so callers can't change the cached token
+            return dict(cached[1])
+
         with open(file_path, "r") as file:
             encoded_token = file.read().strip()
 
@@ -87,7 +118,8 @@ def read_token_from_file() -> Optional[dict]:
 
         token_json_string = _decode_string_base64(encoded_token)
         token: dict = json.loads(token_json_string)
-        return token
+        _set_cached_token(key, token)
+        return dict(token)
 
     except FileNotFoundError:
         # This is an expected case if no token has been stored yet.
@@ -10,7 +10,7 @@ from PyQt5.QtGui import QIcon
 from screeninfo import get_monitors
 
 from utils.bundle_dir import BUNDLE_DIR
-from utils.device_code import DeviceCodeDict
+from utils.device_code import DeviceCodeInfo
 from utils.tray_manager import AppTrayIcon
 from visual.screens.dashboard_screen import DashboardScreen
 from visual.screens.deliverymen_mapping_screen import DeliverymenMappingScreen
@@ -73,7 +73,7 @@ class MainView(QWidget):
         self._layout.setContentsMargins(0, 0, 0, 0)  # Optional: remove padding
         self._layout.addWidget(self.stack)
 
-    def set_device_code_and_qr(self, device_code: DeviceCodeDict):
+    def set_device_code_and_qr(self, device_code: DeviceCodeInfo):
         self.device_code_screen.set_device_code(device_code)
         self.device_code_screen.display_qr_code()
 
@@ -16,6 +16,10 @@ from visual.components.mapping_table_view import MappingTableView
 from visual.fonts import get_fonts
 from visual.screens.loading_screen import LoadingScreen
 
+# Shared by both footer buttons; setSizePolicy copies the value, so a single
+# instance is enough.
+_EXPANDING_FIXED = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
 
 class DeliverymenMappingScreen(QWidget):
     save_config = pyqtSignal()
@@ -51,24 +55,15 @@ class DeliverymenMappingScreen(QWidget):
         self.save_button.setFont(self.fonts["bold"])
         self.save_button.clicked.connect(self.save_config)
         # Make save button expand to fill available space if desired, or keep fixed
-        self.save_button.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Fixed
-        )
+        self.save_button.setSizePolicy(_EXPANDING_FIXED)
 
-        self.cancel_button = QPushButton("Cancelar")
-        self.cancel_button.setCursor(Qt.PointingHandCursor)
-        self.cancel_button.setObjectName("neutral")
-        self.cancel_button.setFont(self.fonts["regular"])
-        self.cancel_button.clicked.connect(self.cancel_config)
-        self.cancel_button.hide()  # Hidden by default (Auto-mode behavior)
-        self.cancel_button.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Fixed
-        )
+        # The Cancel button is only needed in manual mode, so it is built
+        # lazily by set_cancel_visible() the first time it is shown.
+        self.cancel_button: Optional[QPushButton] = None
 
         # Horizontal layout to put Cancel and Save side-by-side
         self.buttons_layout = QHBoxLayout()
         self.buttons_layout.setSpacing(12)
-        self.buttons_layout.addWidget(self.cancel_button)
         self.buttons_layout.addWidget(self.save_button)
 
         self.footer = QWidget()
@@ -97,7 +92,7 @@ class DeliverymenMappingScreen(QWidget):
         self.stack.addWidget(self.loading_screen)
         self.stack.addWidget(self.main_widget)
         self.stack.setCurrentIndex(0)
-        self.set_cancel_visible(True)
+        self.set_cancel_visible(False)  # Hidden by default (Auto-mode behavior)
 
     def populate_table(
         self,
@@ -122,4 +117,18 @@ class DeliverymenMappingScreen(QWidget):
         Controls the visibility of the Cancel button.
         Called by the Presenter/State logic based on manual vs auto mode.
         """
-        self.cancel_button.setVisible(visible)
\ No newline at end of file
+        if self.cancel_button is None:
+            if not visible:
+                return
+            self.cancel_button = self._build_cancel_button()
+            self.buttons_layout.insertWidget(0, self.cancel_button)
+        self.cancel_button.setVisible(visible)
+
+    def _build_cancel_button(self) -> QPushButton:
+        cancel_button = QPushButton("Cancelar")
+        cancel_button.setCursor(Qt.PointingHandCursor)
+        cancel_button.setObjectName("neutral")
+        cancel_button.setFont(self.fonts["regular"])
+        cancel_button.clicked.connect(self.cancel_config)
+        cancel_button.setSizePolicy(_EXPANDING_FIXED)
+        return cancel_button
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QLabel, QWidget, QVBoxLayout
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from utils.device_code import DeviceCodeDict
+from utils.device_code import DeviceCodeInfo
 from visual.fonts import get_fonts
 from visual.components.qr_code import QRCode
 
@@ -8,7 +8,7 @@ from visual.components.qr_code import QRCode
 class DeviceCodeDisplay(QWidget):
     expired = pyqtSignal()
 
-    def __init__(self, device_code: DeviceCodeDict):
+    def __init__(self, device_code: DeviceCodeInfo):
         super().__init__()
         self.fonts = get_fonts()
         self.device_code = device_code
@@ -21,22 +21,22 @@ class DeviceCodeDisplay(QWidget):
 
         self.link_cta_label = QLabel("Ou acesse")
         self.link_cta_label.setFont(self.fonts["light"])
-        self.link_cta_label.setStyleSheet("font-size: 10pt;")
+        self.link_cta_label.setProperty("cls", "small")
         self.link_cta_label.setAlignment(Qt.AlignCenter)
 
         self.code_label = QLabel("Código")
-        self.code_label.setStyleSheet("font-size: 10pt;")
+        self.code_label.setProperty("cls", "small")
         self.code_label.setFont(self.fonts["light"])
 
-        self.code_display = QLabel(device_code["user_code"])
+        self.code_display = QLabel(device_code.user_code)
         self.code_display.setFont(self.fonts["bold"])
         self.code_display.setObjectName("codeDisplay")
         self.code_display.setAlignment(Qt.AlignCenter)
 
         self.login_link = QLabel(
             '<a href="{}" style="color: #0EA5E9">{}</a>'.format(
-                device_code["verification_uri_complete"],
-                device_code["verification_uri"],
+                device_code.verification_uri_complete,
+                device_code.verification_uri,
             )
         )
         self.login_link.setTextFormat(Qt.RichText)
@@ -45,7 +45,7 @@ class DeviceCodeDisplay(QWidget):
         self.login_link.setOpenExternalLinks(True)
         self.login_link.setAlignment(Qt.AlignCenter)
 
-        self.qr_code = QRCode(device_code["verification_uri_complete"], 152)
+        self.qr_code = QRCode(device_code.verification_uri_complete, 152)
 
         self.add_expiration_timer()
 
@@ -67,7 +67,7 @@ class DeviceCodeDisplay(QWidget):
         self.setLayout(self.main_layout)
 
     def add_expiration_timer(self):
-        self.remaining_time = self.device_code["expires_in"]
+        self.remaining_time = self.device_code.expires_in
 
         # Used to update display (updates every second)
         self.timer = QTimer()
@@ -76,7 +76,7 @@ class DeviceCodeDisplay(QWidget):
 
         self.expire_label = QLabel("Expira em ----:----")
         self.expire_label.setFont(self.fonts["light"])
-        self.expire_label.setStyleSheet("font-size: 10pt;")
+        self.expire_label.setProperty("cls", "small")
         self.expire_label.setAlignment(Qt.AlignCenter)
         self.expire_label.update()
 
@@ -25,10 +25,6 @@ class ErrorScreen(QWidget):
         self.error_description.setAlignment(Qt.AlignCenter)
         self.error_description.setWordWrap(True)
 
-        self.error_description.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
-
         # Set the horizontal policy to Preferred and the VERTICAL policy to Fixed.
         # This tells the layout: "You can manage my width, but my height is
         # fixed to whatever my content requires. DO NOT shrink me vertically."
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QLabel, QWidget, QVBoxLayout, QStackedWidget
 from PyQt5.QtCore import Qt, pyqtSignal
-from utils.device_code import DeviceCodeDict
+from utils.device_code import DeviceCodeInfo
 from visual.fonts import get_fonts
 from config import config
 from visual.screens.loading_screen import LoadingScreen
@@ -41,7 +41,7 @@ class DeviceCodeScreen(QWidget):
 
         self.setLayout(self.main_layout)
 
-    def set_device_code(self, device_code: DeviceCodeDict):
+    def set_device_code(self, device_code: DeviceCodeInfo):
         self.device_code = device_code
 
     def display_qr_code(self):
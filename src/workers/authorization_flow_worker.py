@@ -1,14 +1,18 @@
-from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
-from utils.device_code import DeviceCode, DeviceCodeDict
-from utils.access_token import AccessToken, AccessTokenDict
+from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool, QTimer
+from utils.device_code import DeviceCode, DeviceCodeInfo
+from utils.access_token import AccessToken, AccessTokenDict, TokenPollingState
 import logging
+import random
+import threading
 import time
-import traceback
-from typing import Dict, Optional
+from concurrent.futures import Future
+from typing import Optional, Tuple
 from config import AuthenticationConfig
 from models.exceptions import NetworkError, ApiError, TokenPollingError
 from utils.token_storage import store_token_at_file
 
+logger = logging.getLogger(__name__)
+
 
 class AuthorizationFlowSignals(QObject):
     """
@@ -27,14 +31,14 @@ class AuthorizationFlowSignals(QObject):
     error = pyqtSignal(str, str)
     """Signal emitted when an error occurs during the flow.
     
-    Sends a user-friendly message (str) and a detailed traceback (str).
+    Sends a user-friendly message (str) and the error details (str).
     """
 
-    device_code = pyqtSignal(dict)
+    device_code = pyqtSignal(object)
     """Signal emitted after successfully retrieving the device code and
     verification URI.
     
-    Sends the device code info dictionary (dict).
+    Sends the device code info (DeviceCodeInfo).
     """
 
     finished = pyqtSignal()
@@ -42,6 +46,12 @@ class AuthorizationFlowSignals(QObject):
     regardless of whether it succeeded or failed.
     """
 
+    poll_scheduled = pyqtSignal(int)
+    """Internal signal used by the worker to schedule its next poll.
+    
+    Sends the delay in milliseconds (int).
+    """
+
 
 class AuthorizationFlowWorker(QRunnable):
     """
@@ -51,6 +61,10 @@ class AuthorizationFlowWorker(QRunnable):
     It requests a device code, emits it so the user can see it,
     and then polls for the access token. Results are communicated
     via a separate 'signals' object.
+
+    Polling does not hold a pool thread: each poll is a short task
+    submitted to the global QThreadPool, and the wait between polls is a
+    single-shot QTimer living in the thread that created the worker.
     """
 
     # --- Error Constants ---
@@ -62,19 +76,48 @@ class AuthorizationFlowWorker(QRunnable):
     ERROR_UNEXPECTED = "Ocorreu um erro inesperado."
     MISSING_REFRESH_TOKEN = "Erro: Token de atualização não recebido."
 
+    # Upper bound (in seconds) for the backed-off polling interval
+    MAX_POLL_INTERVAL = 30
+
+    # Single-flight guard: flows started while a device code request is
+    # in flight (e.g. a double-click) share that request's result.
+    _inflight_lock = threading.Lock()
+    _inflight_future: "Optional[Future[DeviceCodeInfo]]" = None
+
     def __init__(self, config: AuthenticationConfig):
         """
         Initializes the runnable worker.
 
+        Must be created on a thread with a running Qt event loop
+        (the GUI thread), since it owns the polling timer.
+
         Args:
             config: An AuthenticationConfig object with endpoint details
                     (domain, client_id, etc.).
         """
         super().__init__()
-        self.logger = logging.getLogger(__name__)
+        # The flow outlives run() while polling, so the pool must not
+        # delete this runnable when run() returns. The caller keeps it alive.
+        self.setAutoDelete(False)
         self.config = config
         self.signals = AuthorizationFlowSignals()
-        self._is_running = True  # Flag to allow for cancellation
+        # Set by stop(); checked before every poll
+        self._stop_event = threading.Event()
+
+        # Polling state, filled once the device code is received
+        self._access_token_handler: Optional[AccessToken] = None
+        self._expires_at = 0.0
+        self._base_interval = 0.0
+        self._interval = 0.0
+        self._is_polling = False
+        self._polling_lock = threading.Lock()
+
+        self._poll_timer = QTimer(self.signals)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.timeout.connect(self._start_poll)
+        # The timer lives on the signals' thread, so emits from the pool
+        # threads are queued to it by the default AutoConnection
+        self.signals.poll_scheduled.connect(self._poll_timer.start)
 
     def _emit_error(self, message: str, exception: Optional[Exception] = None):
         """
@@ -83,163 +126,259 @@ class AuthorizationFlowWorker(QRunnable):
         Args:
             message: The user-friendly error message.
             exception: The exception object (if any) for logging.
+                       Its traceback goes to the log, not to the signal.
         """
-        stacktrace = (
-            str(exception) + "\n" + traceback.format_exc()
-            if exception
-            else "No exception info."
-        )
-        self.logger.error(f"{message} - Traceback: {stacktrace}")
-        self.signals.error.emit(message, stacktrace)
+        details = repr(exception) if exception else "No exception info."
+        # The traceback is formatted by the logging handlers, only if needed.
+        # Dropped connections are routine, so theirs is left out entirely.
+        exc_info = None if isinstance(exception, NetworkError) else exception
+        logger.error(f"{message} - {details}", exc_info=exc_info)
+        self.signals.error.emit(message, details)
+
+    def _report_exception(self, exception: Exception):
+        """
+        Maps an exception raised during the flow to a user-friendly error.
+        Must be called from within an 'except' block.
+        """
+        if isinstance(exception, NetworkError):
+            # Specific handling for network issues
+            self._emit_error(self.ERROR_NETWORK, exception)
+        elif isinstance(exception, ApiError):
+            # Craft a more detailed message for the user
+            user_message = (
+                f"O servidor retornou um erro ({exception.status_code}).<br/>"
+                f"Por favor, tente novamente mais tarde."
+            )
+            self._emit_error(user_message, exception)
+        else:
+            # A catch-all for any other unexpected errors
+            self._emit_error(self.ERROR_UNEXPECTED, exception)
 
-    def _get_device_code(self) -> DeviceCodeDict:
+    def _get_device_code(self) -> Tuple[DeviceCodeInfo, bool]:
         """
         Requests the initial device code and verification URI from the
         authorization server.
 
+        If another flow already has a request in flight, waits for it and
+        reuses its result instead of asking the server for a second code.
+
         Raises:
             NetworkError: If a connection error occurs.
             ApiError: If the server returns an unexpected error.
 
         Returns:
-            A dictionary containing device_code, verification_uri, etc.
+            The device code info (device_code, verification_uri, etc.)
+            and whether this flow made the request (True) or joined an
+            in-flight one (False).
         """
-        device_code_handler = DeviceCode(
-            domain=self.config.domain,
-            client_id=self.config.client_id,
-            scope=self.config.scope,
-            audience=self.config.audience,
-        )
-        return device_code_handler.request()
+        cls = type(self)
+        with cls._inflight_lock:
+            future = cls._inflight_future
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                cls._inflight_future = future
+
+        if not is_owner:
+            logger.debug("Reutilizando solicitação de código já em andamento.")
+            return future.result(), False
 
-    def _poll_for_access_token(
-            self, 
-            device_code_info: Dict
-    ) -> Optional[AccessTokenDict]:
+        try:
+            device_code_handler = DeviceCode(
+                domain=self.config.domain,
+                client_id=self.config.client_id,
+                scope=self.config.scope,
+                audience=self.config.audience,
+            )
+            device_code_info = device_code_handler.request()
+            future.set_result(device_code_info)
+            return device_code_info, True
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with cls._inflight_lock:
+                cls._inflight_future = None
+
+    def _start_polling(self, device_code_info: DeviceCodeInfo):
         """
-        Polls the token endpoint until an access token is granted, the
-        code expires, or the task is cancelled.
+        Prepares the polling state and schedules the first poll.
 
         Args:
-            device_code_info: The dictionary received from _get_device_code.
-
-        Returns:
-            The token data on success, or None if the loop
-            is exited (due to expiry or cancellation).
+            device_code_info: The info received from _get_device_code.
         """
-        expires_at = time.time() + device_code_info["expires_in"]
-        interval = device_code_info["interval"]
+        self._expires_at = time.time() + device_code_info.expires_in
+        self._base_interval = device_code_info.interval
+        self._interval = self._base_interval
 
-        access_token_handler = AccessToken(
+        self._access_token_handler = AccessToken(
             domain=self.config.domain,
             client_id=self.config.client_id,
-            device_code=device_code_info["device_code"],
+            device_code=device_code_info.device_code,
         )
 
-        # Loop while NOT cancelled AND token not expired
-        while self._is_running and time.time() < expires_at:
-            try:
-                token_data = access_token_handler.request()
-                # SUCCESS! We got the token.
-                store_token_at_file(token_data)  # Store it securely
-                return token_data
-
-            except TokenPollingError as e:
-                # Handle specific OAuth errors
-                if e.error_code == "authorization_pending":
-                    # This is normal, just continue polling
-                    self.logger.debug(
-                        "Autorização pendente, continuando soliticações..."
-                    )
-                elif e.error_code == "slow_down":
-                    # Server is asking us to poll less frequently
-                    interval += 5  # Increase the interval
-                    self.logger.warning("Servidor solicitou para ir devagar.")
-                elif e.error_code in ["access_denied", "expired_token"]:
-                    # These are terminal errors, stop polling.
-                    self.logger.error(f"Erro terminal de autenticação: {e.error_code}")
-                    raise e  # Re-raise to be caught by the main run() method
-                else:
-                    # Unknown OAuth error
-                    raise e  # Let the main 'run' method handle it
+        self._is_polling = True
+        self._schedule_next_poll()
+
+    def _schedule_next_poll(self):
+        """Asks the timer (on its own thread) to fire after the current interval."""
+        self.signals.poll_scheduled.emit(int(self._interval * 1000))
+
+    def _start_poll(self):
+        """Timer slot: runs a single poll on the global thread pool."""
+        QThreadPool.globalInstance().start(self._poll_once)
+
+    def _back_off(self, retry_after: Optional[float] = None):
+        """
+        Doubles the polling interval, with jitter, up to MAX_POLL_INTERVAL.
+        A server-provided 'Retry-After' (in seconds) is used as a minimum.
+        """
+        interval = min(self.MAX_POLL_INTERVAL, self._interval * 2)
+        interval += random.uniform(0, 1)
+        if retry_after is not None:
+            interval = max(interval, retry_after)
+        self._interval = interval
 
-            except (NetworkError, ApiError) as e:
-                # Handle connection or unexpected server errors
-                self.logger.error(
-                    f"Parando solicitações devido à erro na rede/API: {e}"
-                )
-                raise e  # Let the main 'run' method catch and report this
+    def _request_access_token(self) -> Optional[AccessTokenDict]:
+        """
+        Performs a single request to the token endpoint.
 
-            # Wait for the specified interval, but check for cancellation
-            # to avoid a long, unnecessary sleep if stop() was called.
-            # We do this by sleeping in small chunks.
-            sleep_end = time.time() + interval
-            while self._is_running and time.time() < sleep_end:
-                time.sleep(0.5)  # Sleep in 500ms increments
+        Returns:
+            The token data on success, or None if the user has not
+            authorized the device yet (and the next poll should happen).
 
-        # If the loop finishes, the code either expired or was cancelled
-        if not self._is_running:
-            self.logger.debug("Polling foi cancelado pelo usuário.")
+        Raises:
+            ApiError: On unexpected server errors.
+            TokenPollingError: On terminal OAuth errors.
+        """
+        assert self._access_token_handler is not None
+        try:
+            result = self._access_token_handler.try_request()
+        except NetworkError as e:
+            # Connection problems are transient: back off and keep polling
+            # until the device code expires.
+            self._back_off()
+            logger.warning(
+                f"Falha de rede ao solicitar token, tentando novamente: {e}"
+            )
+            return None
+        except ApiError as e:
+            # Handle unexpected server errors
+            logger.error(
+                f"Parando solicitações devido à erro na rede/API: {e}"
+            )
+            raise e  # Let the caller catch and report this
+
+        # Handle the expected OAuth polling responses
+        if result is TokenPollingState.PENDING:
+            # This is normal, just continue polling.
+            # Decay back towards the server's interval after a slow_down.
+            self._interval = max(self._base_interval, self._interval * 0.9)
+            logger.debug(
+                "Autorização pendente, continuando soliticações..."
+            )
+            return None
+        if result is TokenPollingState.SLOW_DOWN:
+            # Server is asking us to poll less frequently.
+            self._back_off(self._access_token_handler.retry_after)
+            logger.warning("Servidor solicitou para ir devagar.")
+            return None
+        if isinstance(result, TokenPollingState):
+            # "access_denied" and "expired_token" are terminal errors.
+            logger.error(f"Erro terminal de autenticação: {result.value}")
+            raise TokenPollingError(error_code=result.value)
+
+        # SUCCESS! We got the token.
+        store_token_at_file(result)  # Store it securely
+        return result
+
+    def _emit_tokens(self, token_data: AccessTokenDict):
+        """Emits the received tokens, or an error if one of them is missing."""
+        access_token = token_data.get("access_token")
+        refresh_token = token_data.get("refresh_token")
+
+        if access_token and refresh_token:
+            # Emit both tokens!
+            self.signals.authenticated.emit(access_token, refresh_token)
+        else:
+            # Edge case: Server didn't send a refresh token? 
+            # Check your Auth0/Cognito "Offline Access" scope settings.
+            self._emit_error(self.MISSING_REFRESH_TOKEN)
+
+    def _poll_once(self):
+        """
+        Runs on a pool thread. Polls the token endpoint once and either
+        finishes the flow or schedules the next poll.
+        """
+        is_done = True
+        try:
+            if self._stop_event.is_set():
+                # Cancelled: we just finish silently
+                logger.debug("Polling foi cancelado pelo usuário.")
+            elif time.time() >= self._expires_at:
+                self._emit_error(self.ERROR_CODE_EXPIRED)
+            else:
+                token_data = self._request_access_token()
+                if token_data is not None:
+                    self._emit_tokens(token_data)
+                elif self._stop_event.is_set():
+                    # Stopped while the request was in flight: don't wait
+                    # another interval just to find that out.
+                    logger.debug("Polling foi cancelado pelo usuário.")
+                else:
+                    is_done = False
+                    self._schedule_next_poll()
+        except Exception as e:
+            self._report_exception(e)
+        finally:
+            if is_done:
+                self._finish_polling()
 
-        return None
+    def _finish_polling(self):
+        """
+        Emits 'finished' for the polling phase, once.
+        stop() can trigger an extra poll while another one is in flight,
+        and both would otherwise finish the flow.
+        """
+        with self._polling_lock:
+            if not self._is_polling:
+                return
+            self._is_polling = False
+        self.signals.finished.emit()
 
     def run(self):
         """
         The main execution method for the QRunnable.
 
-        Performs the full device authorization flow:
-        1. Gets the device code.
+        Starts the device authorization flow:
+        1. Gets the device code (or joins a request already in flight).
         2. Emits the code via the signals object.
-        3. Polls for the access token.
-        4. Emits the token on success or an error on failure.
-        5. Emits 'finished' when done.
+        3. Schedules the polling for the access token and returns.
+           Flows that joined another request finish here instead.
+
+        Each poll then emits the token on success, an error on failure,
+        or schedules the next poll. 'finished' is emitted once the flow ends.
         """
         try:
             # Step 1: Get device code
-            device_code_info = self._get_device_code()
-            if not self._is_running:  # Check for cancellation after first network call
+            device_code_info, is_owner = self._get_device_code()
+            # Check for cancellation after first network call
+            if self._stop_event.is_set():
+                self.signals.finished.emit()
                 return
             self.signals.device_code.emit(device_code_info)
 
-            # Step 2: Poll for the access token
-            token_data = self._poll_for_access_token(device_code_info)
-
-            # Step 3: Handle the result
-            if token_data:
-                access_token = token_data.get("access_token")
-                refresh_token = token_data.get("refresh_token")
-
-                if access_token and refresh_token:
-                    # Emit both tokens!
-                    self.signals.authenticated.emit(access_token, refresh_token)
-                else:
-                    # Edge case: Server didn't send a refresh token? 
-                    # Check your Auth0/Cognito "Offline Access" scope settings.
-                    self._emit_error(self.MISSING_REFRESH_TOKEN)
-            else:
-                # This handles both expired and cancelled scenarios
-                if self._is_running:
-                    # Only emit "expired" error if we weren't manually stopped
-                    self._emit_error(self.ERROR_CODE_EXPIRED)
-                # If 'self._is_running' is false, we just finish silently
-
-        except NetworkError as e:
-            # Specific handling for network issues
-            self._emit_error(self.ERROR_NETWORK, e)
-
-        except ApiError as e:
-            # Craft a more detailed message for the user
-            user_message = (
-                f"O servidor retornou um erro ({e.status_code}).<br/>"
-                f"Por favor, tente novamente mais tarde."
-            )
-            self._emit_error(user_message, e)
+            if not is_owner:
+                # The flow that requested this code polls for its token and
+                # reports the result; polling it twice would make the second
+                # flow fail once the code is consumed.
+                self.signals.finished.emit()
+                return
 
+            # Step 2: Poll for the access token, without blocking this thread
+            self._start_polling(device_code_info)
         except Exception as e:
-            # A catch-all for any other unexpected errors
-            self._emit_error(self.ERROR_UNEXPECTED, e)
-        finally:
-            # Always emit 'finished'
+            self._report_exception(e)
             self.signals.finished.emit()
 
     def stop(self):
@@ -247,5 +386,8 @@ class AuthorizationFlowWorker(QRunnable):
         Public method to signal the worker to stop polling.
         The worker will stop polling and exit cleanly.
         """
-        self.logger.debug("Sinal de parada recebido...")
-        self._is_running = False
+        logger.debug("Sinal de parada recebido...")
+        self._stop_event.set()
+        if self._is_polling:
+            # Fire the pending poll right away, so it can finish the flow
+            self.signals.poll_scheduled.emit(0)
@@ -1,29 +1,88 @@
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
 import json
+import mmap
 import os
+import re
+import threading
 import time
 
+import orjson
+
+from utils.cds_checkpoint import read_cds_checkpoint, store_cds_checkpoint
+
+logger = logging.getLogger(__name__)
+
+
+def _loads_cds_json(raw: Union[bytes, memoryview]) -> Any:
+    """
+    Parses the raw bytes of a CDS log file.
+
+    CDS writes the files as windows-1252. Most of them are plain ASCII (and
+    therefore valid UTF-8), so they are parsed directly; only files with
+    non-ASCII characters need to be decoded first.
+    """
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return orjson.loads(bytes(raw).decode("windows-1252"))
+
 
 class _NewFileHandler(FileSystemEventHandler):
     """
     An internal event handler for watchdog that processes file creation events.
     It's designed to be used exclusively by CdsLogsListenerWorker.
+
+    Creation events are coalesced: matching paths are collected (duplicates
+    collapse into one entry) and processed together once no new event has
+    arrived for DEBOUNCE_SECONDS, so a burst of files is emitted as one batch.
     """
 
-    def __init__(self, signals_instance: "CdsLogsListenerSignals"):
+    # Quiet period (in seconds) after the last event before processing files
+    DEBOUNCE_SECONDS = 0.15
+    # Files modified more recently than this are probably still being written
+    MIN_FILE_AGE_SECONDS = 0.05
+    # Gap (in seconds) between the size reads of the stability check
+    SIZE_CHECK_INTERVAL = 0.015
+    # How long (in seconds) to wait for a file's size to settle
+    SIZE_CHECK_TIMEOUT = 1.0
+    # How many processed files are remembered to skip duplicate events
+    SEEN_CAPACITY = 1024
+    # Matches paths whose file name follows the "ent*.json" convention
+    _MATCH = re.compile(r"(?:^|[/\\])ent[^/\\]*\.json$")
+
+    def __init__(
+        self,
+        signals_instance: "CdsLogsListenerSignals",
+        checkpoint_path: Optional[str] = None,
+    ):
         """
         Initializes the handler.
 
         Args:
             signals_instance (CdsLogsListenerSignals): The QObject responsible
                                                         for emitting signals.
+            checkpoint_path (Optional[str]): If given, the mtime of the newest
+                                             processed file is saved there
+                                             after every batch.
         """
         super().__init__()
         self.signals = signals_instance  # Store the signals object
-        self.logger = logging.getLogger(__name__)
+
+        # Paths waiting to be processed, mapped to when they were last seen
+        self._pending: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # (inode, mtime, size) of recently processed files, oldest first.
+        # Some setups fire 'created' twice for one file (rename + write).
+        self._seen: "OrderedDict[Tuple[int, int, int], None]" = OrderedDict()
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_ns = 0
 
     def on_created(self, event):
         """
@@ -34,42 +93,176 @@ class _NewFileHandler(FileSystemEventHandler):
 
         try:
             filepath = event.src_path
-            filename = os.path.basename(filepath)
 
-            # Check if the file matches the specified naming convention
-            if filename.startswith("ent") and filename.endswith(".json"):
-                self.logger.debug(f"Novo potencial pedido encontrado: {filename}")
-                self._process_file(filepath)
+            # Check if the file matches the specified naming convention.
+            # Most events in a busy folder don't, so bail out early.
+            if not self._MATCH.search(filepath):
+                return
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Novo potencial pedido encontrado: "
+                    f"{os.path.basename(filepath)}"
+                )
+            self._enqueue([filepath])
         except Exception:
             # Catch any unexpected errors during event handling
-            self.logger.exception(
+            logger.exception(
                 "Um erro inesperado ocorreu no gerenciador de arquivos adicionados."
             )
 
-    def _process_file(self, filepath):
+    def flush(self):
         """
-        Reads and parses the JSON file, emitting signals on success or failure.
+        Cancels the debounce timer and processes every pending file now.
         """
-        try:
-            # A small delay can help prevent reading files that are still being written.
-            time.sleep(0.1)
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._flush()
+
+    def _enqueue(self, filepaths: List[str]):
+        """Adds paths to the pending set and (re)starts the debounce timer."""
+        with self._lock:
+            now = time.monotonic()
+            for filepath in filepaths:
+                self._pending[filepath] = now
+
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self):
+        """
+        Processes all pending files, oldest first, and emits them as one batch.
+        Files that still look like they are being written are re-queued.
+        """
+        with self._lock:
+            filepaths = list(self._pending)
+            self._pending.clear()
+            self._timer = None
 
-            with open(filepath, "r", encoding="windows-1252") as f:
-                content = json.load(f)
+        ready: List[Tuple[int, str]] = []
+        not_ready: List[str] = []
+        now = time.time()
+        for filepath in filepaths:
+            try:
+                stat = os.stat(filepath)
+                if now - stat.st_mtime < self.MIN_FILE_AGE_SECONDS or not (
+                    self._wait_until_stable(filepath)
+                ):
+                    not_ready.append(filepath)
+                else:
+                    ready.append((stat.st_mtime_ns, filepath))
+            except OSError:
+                logger.exception(
+                    f"Erro no sistema de arquivos ao ler arquivo: {filepath}"
+                )
 
-            self.logger.debug(f"Conteúdo JSON lido com sucesso de: {filepath}")
+        if not_ready:
+            self._enqueue(not_ready)
+
+        batch = []
+        for _, filepath in sorted(ready):
+            content = self._process_file(filepath)
+            if content is not None:
+                batch.append(content)
+
+        if batch:
             # Emit the signal via the signals object
-            self.signals.new_order.emit(content)
-        except json.JSONDecodeError:
-            self.logger.exception(f"Falha ao decodificar JSON do arquivo: {filepath}")
+            self.signals.new_order.emit(batch)
+
+        if ready:
+            self._save_checkpoint(max(mtime_ns for mtime_ns, _ in ready))
+
+    def _save_checkpoint(self, mtime_ns: int):
+        """Saves 'mtime_ns' as the processed mark, if it moves the mark forward."""
+        if self._checkpoint_path is None:
+            return
+        with self._lock:
+            if mtime_ns <= self._checkpoint_ns:
+                return
+            self._checkpoint_ns = mtime_ns
+            store_cds_checkpoint(mtime_ns, self._checkpoint_path)
+
+    def _wait_until_stable(self, filepath: str) -> bool:
+        """
+        Polls the file size until two successive reads match.
+
+        Returns:
+            True once the size is stable, or False if it was still
+            changing after SIZE_CHECK_TIMEOUT.
+        """
+        deadline = time.monotonic() + self.SIZE_CHECK_TIMEOUT
+        size = os.stat(filepath).st_size
+        while True:
+            time.sleep(self.SIZE_CHECK_INTERVAL)
+            new_size = os.stat(filepath).st_size
+            if new_size == size:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            size = new_size
+
+    def _mark_seen(self, stat: os.stat_result) -> bool:
+        """
+        Records a file as processed.
+
+        Returns:
+            False if the same file (inode, mtime and size) was seen before.
+        """
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen[key] = None
+            if len(self._seen) > self.SEEN_CAPACITY:
+                self._seen.popitem(last=False)
+        return True
+
+    def _process_file(self, filepath) -> Optional[Any]:
+        """
+        Reads and parses the JSON file.
+
+        Returns:
+            The JSON content (dict or list), or None on failure or if
+            this exact file was already processed.
+        """
+        try:
+            # Memory-map the file so it is parsed without an extra copy
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                stat = os.fstat(fd)
+                if not self._mark_seen(stat):
+                    logger.debug(f"Arquivo já processado, ignorando: {filepath}")
+                    return None
+
+                if stat.st_size == 0:
+                    # Empty files can't be mapped; let the parser reject them
+                    content = _loads_cds_json(b"")
+                else:
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as raw:
+                            content = _loads_cds_json(raw)
+            finally:
+                os.close(fd)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Conteúdo JSON lido com sucesso de: {filepath}")
+            return content
+        except (json.JSONDecodeError, orjson.JSONDecodeError):
+            logger.exception(f"Falha ao decodificar JSON do arquivo: {filepath}")
         except (IOError, OSError, PermissionError):
-            self.logger.exception(
+            logger.exception(
                 f"Erro no sistema de arquivos ao ler arquivo: {filepath}"
             )
         except Exception:
-            self.logger.exception(
+            logger.exception(
                 f"Um erro inesperado ocorreu ao ler o arquivo: {filepath}"
             )
+        return None
 
 
 class CdsLogsListenerSignals(QObject):
@@ -79,8 +272,11 @@ class CdsLogsListenerSignals(QObject):
     define or emit its own pyqtSignals.
     """
 
-    # Signal emitted when a new valid log file is found and parsed.
-    # The payload will be the JSON content (dict or list).
+    # Signal emitted when new valid log files are found and parsed.
+    # The payload is a list with the JSON content (dict or list) of each file,
+    # oldest first. Declared as 'object' so the list is handed over by
+    # reference: a 'list' signal would be deep-copied through QVariant when
+    # crossing from the watchdog thread to the GUI thread.
     new_order = pyqtSignal(object)
 
     # Signal emitted when the worker runnable has finished its execution.
@@ -99,17 +295,32 @@ class CdsLogsListenerWorker(QRunnable):
     To use this, create an instance and submit it to a QThreadPool.
     """
 
-    def __init__(self, folder_path: str):
+    def __init__(
+        self,
+        folder_path: str,
+        process_files_since: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
         """
         Initializes the worker.
 
         Args:
             folder_path (str): The absolute path to the folder to monitor.
+            process_files_since (Optional[float]): If given, matching files
+                already in the folder and modified at or after this timestamp
+                are processed on startup, so orders written while nothing was
+                listening aren't lost.
+            checkpoint_path (Optional[str]): File keeping the mtime of the
+                newest processed order. When it holds a mark, startup
+                processes every matching file modified after it instead,
+                including those written while the app was closed.
         """
         super().__init__()
         self.folder_path = folder_path
+        self.process_files_since = process_files_since
+        self.checkpoint_path = checkpoint_path
         self._observer = None
-        self.logger = logging.getLogger(__name__)
+        self._event_handler: Optional[_NewFileHandler] = None
 
         # Create the separate signals object
         self.signals = CdsLogsListenerSignals()
@@ -122,47 +333,106 @@ class CdsLogsListenerWorker(QRunnable):
         try:
             if not os.path.isdir(self.folder_path):
                 msg = f"Diretório fornecido não é valido: {self.folder_path}"
-                self.logger.error(msg)
+                logger.error(msg)
                 self.signals.error.emit(msg)  # Emit error signal
                 return  # Stop execution
 
-            event_handler = _NewFileHandler(self.signals)  # Pass the signals object
+            # Pass the signals object
+            self._event_handler = _NewFileHandler(
+                self.signals, checkpoint_path=self.checkpoint_path
+            )
             self._observer = Observer()
-            self._observer.schedule(event_handler, self.folder_path, recursive=False)
+            if isinstance(self._observer, PollingObserver):
+                # No native notification API (e.g. unusual platform):
+                # watchdog will scan the folder periodically instead.
+                logger.warning(
+                    "Notificações nativas de arquivos indisponíveis. "
+                    "Usando monitoramento por varredura periódica (mais lento)."
+                )
+            else:
+                logger.debug(
+                    f"Observador de arquivos: {type(self._observer).__name__}"
+                )
+            self._observer.schedule(
+                self._event_handler, self.folder_path, recursive=False
+            )
             self._observer.start()
-            self.logger.info(
+            logger.info(
                 f"Monitoramento de entregas iniciado na pasta: {self.folder_path}"
             )
+            # Scanned after the observer started, so no file falls in
+            # between; paths seen by both collapse in the pending set.
+            since_ns = self._scan_start_ns()
+            if since_ns is not None:
+                self._enqueue_existing_files(since_ns)
         except Exception as e:
-            self.logger.exception(
+            logger.exception(
                 "Falha ao iniciar ou executar o observador de arquivos."
             )
             self.signals.error.emit(f"Erro no observador: {e}")
         finally:
             if self._observer:
                 self._observer.join()  # Wait for the observer thread to terminate
-            self.logger.info(
+            logger.info(
                 f"Monitoramento de arquivos foi parado: {self.folder_path}"
             )
             self.signals.finished.emit()  # Signal that this runnable is done
 
+    def _scan_start_ns(self) -> Optional[int]:
+        """
+        Returns the mtime (in ns) from which existing files are processed:
+        right after the saved mark, or 'process_files_since' if there's none.
+        """
+        if self.checkpoint_path is not None:
+            checkpoint_ns = read_cds_checkpoint(self.checkpoint_path)
+            if checkpoint_ns is not None:
+                return checkpoint_ns + 1
+        if self.process_files_since is not None:
+            return int(self.process_files_since * 1_000_000_000)
+        return None
+
+    def _enqueue_existing_files(self, since_ns: int):
+        """
+        Feeds matching files modified at or after 'since_ns' (in ns) to the
+        event handler, which batches them like newly created files.
+        """
+        assert self._event_handler is not None
+        with os.scandir(self.folder_path) as entries:
+            filepaths = [
+                entry.path
+                for entry in entries
+                if _NewFileHandler._MATCH.search(entry.name)
+                and entry.is_file()
+                and entry.stat().st_mtime_ns >= since_ns
+            ]
+
+        if filepaths:
+            logger.info(
+                f"{len(filepaths)} pedido(s) criado(s) antes do início "
+                "do monitoramento serão processados."
+            )
+            self._event_handler._enqueue(filepaths)
+
     def stop(self):
         """
         Stops the file system monitoring.
         """
         if not self._observer:
-            self.logger.warning("Observador não está sendo executado.")
+            logger.warning("Observador não está sendo executado.")
             self.finished.emit()
             return
 
         try:
             self._observer.stop()
             self._observer.join()  # Wait for the thread to terminate
-            self.logger.info(
+            if self._event_handler is not None:
+                # Don't drop files still waiting for the debounce window
+                self._event_handler.flush()
+            logger.info(
                 f"Monitoramento de arquivos foi parado: {self.folder_path}"
             )
         except Exception:
-            self.logger.exception(
+            logger.exception(
                 "Um erro ocorreu ao tentar interromper o observador de arquivos."
             )
         finally:
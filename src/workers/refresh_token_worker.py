@@ -1,14 +1,34 @@
-from typing import cast
+from concurrent.futures import Future
+from typing import Dict, NamedTuple, Optional, Tuple, cast
+from urllib.parse import urlencode
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
 import requests
 import json
 import logging
+import threading
 
 from config import AuthenticationConfig
 from models.exceptions import TokenStorageError
 from utils.access_token import AccessTokenDict
+from utils.oauth_session import OAUTH_TIMEOUT, oauth_refresh_session
 from utils.token_storage import store_token_at_file
 
+logger = logging.getLogger(__name__)
+
+
+class _RefreshOutcome(NamedTuple):
+    """Result of a refresh, replayed to every worker that shared it."""
+
+    tokens: Optional[Tuple[str, str]] = None  # (access_token, refresh_token)
+    error: Optional[str] = None
+
+
+# Refreshes in flight, keyed by refresh token. Rotating refresh tokens can
+# only be used once, so concurrent workers for the same token share a
+# single request instead of racing each other into 'invalid_grant'.
+_inflight_refreshes: "Dict[str, Future[_RefreshOutcome]]" = {}
+_inflight_lock = threading.Lock()
+
 
 class RefreshTokenSignals(QObject):
     """
@@ -56,7 +76,6 @@ class RefreshTokenWorker(QRunnable):
                          client_id, etc.
         """
         super().__init__()
-        self.logger = logging.getLogger(__name__)
 
         # Store dependencies
         self._refresh_token = refresh_token
@@ -71,6 +90,8 @@ class RefreshTokenWorker(QRunnable):
             "scope": auth_config.scope,
             "refresh_token": self._refresh_token,
         }
+        # Form-encoded once; requests sends bytes bodies as they are.
+        self._body = urlencode(self.data).encode("ascii")
 
     def run(self):
         """
@@ -80,10 +101,30 @@ class RefreshTokenWorker(QRunnable):
         On success, it emits the new token and stores the full response.
         On failure, it logs the error. It always emits 'finished'
         when the task is complete.
+
+        If another worker is already refreshing the same token, no request
+        is made: this worker emits that worker's result once it is done.
         """
+        with _inflight_lock:
+            future = _inflight_refreshes.get(self._refresh_token)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                _inflight_refreshes[self._refresh_token] = future
+
+        if not is_owner:
+            logger.debug("Reutilizando recarregamento de token em andamento.")
+            future.add_done_callback(lambda done: self._emit_outcome(done.result()))
+            return
+
+        outcome = _RefreshOutcome()
         try:
-            response = requests.post(
-                self.url, headers=self.headers, data=self.data, verify=False
+            response = oauth_refresh_session.post(
+                self.url,
+                headers=self.headers,
+                data=self._body,
+                verify=True,
+                timeout=OAUTH_TIMEOUT,
             )
 
             # If the refresh token is revoked or the user was deleted, 
@@ -92,7 +133,9 @@ class RefreshTokenWorker(QRunnable):
                 try:
                     error_data = response.json()
                     if error_data.get("error") == "invalid_grant":
-                        self.signals.error.emit("Sessão expirada. Faça login novamente.")
+                        outcome = _RefreshOutcome(
+                            error="Sessão expirada. Faça login novamente."
+                        )
                         return
                 except ValueError:
                     pass  # Not JSON, proceed to standard error handling
@@ -110,33 +153,44 @@ class RefreshTokenWorker(QRunnable):
 
             access_token = jsonResponse["access_token"]
 
-            # Emit success signal
-            self.signals.token.emit(access_token, self._refresh_token)
+            # Success: the token is emitted even if storing it fails below
+            outcome = _RefreshOutcome(tokens=(access_token, self._refresh_token))
 
             # Store the new token bundle
             store_token_at_file(jsonResponse)
         except requests.HTTPError:
             # Catches non-2xx responses from raise_for_status()
-            self.logger.exception(
+            logger.exception(
                 "Ocorreu um erro no servidor during a solitação " \
                 "para recarregar token de acesso."
             )
         except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             # Catches network-level errors
-            self.logger.exception(
+            logger.exception(
                 "Falha ao conectar com o servidor para recarregar token de acesso."
             )
         except requests.RequestException:
             # A catch-all for other 'requests' library errors
-            self.logger.exception(
+            logger.exception(
                 "Falha ao solicitar recarregamento do token de acesso."
             )
         except json.JSONDecodeError:
-            self.logger.exception("Servidor não retornou um JSON válido.")
+            logger.exception("Servidor não retornou um JSON válido.")
         except TokenStorageError:
-            self.logger.exception("Falha ao armazenar token de acesso.")
+            logger.exception("Falha ao armazenar token de acesso.")
         except Exception:
-            self.logger.exception("Erro inesperado ao recarregar o token de acesso.")
+            logger.exception("Erro inesperado ao recarregar o token de acesso.")
         finally:
-            # Always emit the 'finished' signal
-            self.signals.finished.emit()
+            with _inflight_lock:
+                del _inflight_refreshes[self._refresh_token]
+            future.set_result(outcome)
+            self._emit_outcome(outcome)
+
+    def _emit_outcome(self, outcome: _RefreshOutcome):
+        """Emits the token or error of a refresh, then 'finished'."""
+        if outcome.tokens is not None:
+            self.signals.token.emit(*outcome.tokens)
+        elif outcome.error is not None:
+            self.signals.error.emit(outcome.error)
+        # Always emit the 'finished' signal
+        self.signals.finished.emit()
@@ -1,6 +1,6 @@
-import sys
 import logging
-from typing import List, Optional, Tuple
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
@@ -19,8 +19,10 @@ class SQLiteWorkerSignals(QObject):
     # Signal emitted when the task is finished.
     finished = pyqtSignal()
 
-    # Signal emitted with exception info (type, value, traceback) if an error occurs.
-    error = pyqtSignal(tuple)
+    # Signal emitted with the exception type name and message if an error occurs.
+    # The traceback stays in the log: shipping it across threads would keep
+    # every frame's locals alive until the signal is delivered.
+    error = pyqtSignal(str, str)
 
     # Signal emitted with the result of the operation.
     # We use 'object' as the type to handle any return type
@@ -28,6 +30,52 @@ class SQLiteWorkerSignals(QObject):
     result = pyqtSignal(object)
 
 
+class SQLiteWorkerSignalsPool:
+    """
+    Reuses SQLiteWorkerSignals objects across tasks instead of creating
+    a new QObject for each one.
+
+    The caller hands a signals object back with release() from its
+    'finished' slot, once it's done with it. Must be used from the thread
+    the signals are delivered to (the GUI thread).
+    """
+
+    # Idle signals objects kept around for reuse
+    MAX_SIZE = 16
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        self._max_size = max_size
+        self._free: List[SQLiteWorkerSignals] = []
+        # Handed out and not released yet. The pool holds them, as the
+        # worker that references them can be deleted before 'finished'
+        # is delivered.
+        self._in_use: Set[SQLiteWorkerSignals] = set()
+
+    def acquire(self) -> SQLiteWorkerSignals:
+        """Returns an unconnected signals object, reused when possible."""
+        signals = self._free.pop() if self._free else SQLiteWorkerSignals()
+        self._in_use.add(signals)
+        return signals
+
+    def release(self, signals: SQLiteWorkerSignals):
+        """
+        Removes all the connections of a signals object and keeps it for
+        reuse. Call it from the last slot connected to 'finished': Qt drops
+        queued calls whose connection is removed before they're delivered.
+        """
+        # 'finished' is the last signal a worker emits, and queued signals
+        # arrive in order, so nothing else is pending for these connections.
+        for signal in (signals.result, signals.error, signals.finished):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing connected
+
+        self._in_use.discard(signals)
+        if len(self._free) < self._max_size:
+            self._free.append(signals)
+
+
 class SQLiteWorker(QRunnable):
     """
     QRunnable worker for executing SQLiteManager operations in a thread pool.
@@ -36,6 +84,30 @@ class SQLiteWorker(QRunnable):
     for specific database operations.
     """
 
+    # Operation name -> SQLiteManager method, resolved once at import time
+    _DISPATCH: Dict[str, Callable[..., Any]] = {
+        "add_mapping": SQLiteManager.add_mapping,
+        "add_many_mappings": SQLiteManager.add_many_mappings,
+        "get_local_id": SQLiteManager.get_local_id,
+        "get_velide_id": SQLiteManager.get_velide_id,
+        "delete_mapping_by_velide_id": SQLiteManager.delete_mapping_by_velide_id,
+        "get_all_mappings": SQLiteManager.get_all_mappings,
+        "add_delivery_mapping": SQLiteManager.add_delivery_mapping,
+        "add_many_delivery_mappings": SQLiteManager.add_many_delivery_mappings,
+        "update_delivery_status": SQLiteManager.update_delivery_status,
+        "get_delivery_by_external_id": SQLiteManager.get_delivery_by_external_id,
+        "get_delivery_by_internal_id": SQLiteManager.get_delivery_by_internal_id,
+        "get_all_deliveries": SQLiteManager.get_all_deliveries,
+        "get_active_deliveries": SQLiteManager.get_active_deliveries,
+        "prune_old_deliveries": SQLiteManager.prune_old_deliveries,
+    }
+
+    # Operations that only read, run on a read-only connection so they
+    # don't wait for writes
+    _READ_ONLY_OPERATIONS: FrozenSet[str] = frozenset(
+        name for name in _DISPATCH if name.startswith("get_")
+    )
+
     def __init__(
         self, signals: SQLiteWorkerSignals, db_path: str, operation_name: str, *args
     ):
@@ -48,14 +120,33 @@ class SQLiteWorker(QRunnable):
             db_path: Path to the SQLite database.
             operation_name: The string name of the method to call on SQLiteManager.
             *args: Arguments to pass to the method.
+
+        Raises:
+            AttributeError: If 'operation_name' is not a known operation.
         """
         super().__init__()
+        method = self._DISPATCH.get(operation_name)
+        if method is None:
+            raise AttributeError(
+                f"SQLiteManager does not have method '{operation_name}'"
+            )
+
         self.signals = signals
         self.db_path = db_path
         self.operation_name = operation_name
         self.args = args
+        self._method = method
+        self._read_only = operation_name in self._READ_ONLY_OPERATIONS
         self.logger = logging.getLogger(__name__)
 
+        # Set once run() returns, for callers that can't wait on 'finished'
+        self.done = threading.Event()
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the operation only reads (and runs on a read-only connection)."""
+        return self._read_only
+
     # -----------------------------------------------------------------
     # Factory Methods: Deliverymen Mapping
     # -----------------------------------------------------------------
@@ -208,30 +299,22 @@ class SQLiteWorker(QRunnable):
         try:
             # We use the SQLiteManager as a context manager,
             # just as it was designed.
-            with SQLiteManager(self.db_path) as db:
-                # Get the actual method to call from the db instance
-                # using its string name (e.g., 'add_mapping')
-                if not hasattr(db, self.operation_name):
-                    raise AttributeError(
-                        f"SQLiteManager does not have method '{self.operation_name}'"
-                    )
-
-                method_to_call = getattr(db, self.operation_name)
-
+            with SQLiteManager(self.db_path, read_only=self._read_only) as db:
                 # Call the method with the stored arguments
-                op_result = method_to_call(*self.args)
+                op_result = self._method(db, *self.args)
 
-                # Emit the result back to the main thread
-                self.signals.result.emit(op_result)
+            # Emit the result back to the main thread, only once the
+            # changes are committed and visible to other connections
+            self.signals.result.emit(op_result)
 
-        except Exception:
-            # An error occurred, emit the error signal with traceback info
+        except Exception as e:
+            # An error occurred, log the traceback and emit a short description
             self.logger.exception(
                 f"Erro no SQLiteWorker executando {self.operation_name}"
             )
-            tb_info = sys.exc_info()
-            self.signals.error.emit(tb_info)
+            self.signals.error.emit(type(e).__name__, str(e))
 
         finally:
             # Always emit the 'finished' signal
             self.signals.finished.emit()
+            self.done.set()
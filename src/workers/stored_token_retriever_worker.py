@@ -1,8 +1,43 @@
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
-import jwt
 from models.exceptions import TokenStorageError
 from utils.token_storage import read_token_from_file
+from typing import Optional
+import base64
+import functools
 import logging
+import time
+
+import orjson
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_exp(access_token: str) -> Optional[int]:
+    """
+    Reads the 'exp' claim of a JWT without verifying its signature.
+
+    Only the payload segment is decoded (no PyJWT header/algorithm
+    handling), and the result is cached, since the same stored token
+    is checked again and again.
+
+    Returns:
+        The expiration timestamp, or None if the token has no 'exp' claim.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    _, payload_b64, _ = access_token.split(".")
+    # JWTs strip the base64 padding; restore it before decoding
+    padding = "=" * (-len(payload_b64) % 4)
+    claims = orjson.loads(base64.urlsafe_b64decode(payload_b64 + padding))
+    if not isinstance(claims, dict):
+        raise ValueError("O payload do token não é um objeto JSON.")
+
+    exp = claims.get("exp")
+    if exp is None:
+        return None
+    if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+        raise ValueError("A data de expiração (exp) do token é inválida.")
+    return int(exp)
 
 
 class StoredTokenRetrieverSignals(QObject):
@@ -60,18 +95,19 @@ class StoredTokenRetrieverWorker(QRunnable):
             True if the token is expired or invalid, False otherwise.
         """
         try:
-            jwt_options = {"verify_signature": False, "verify_exp": True}
-            # This will raise ExpiredSignatureError (a subclass of InvalidTokenError)
-            # if the 'exp' claim is in the past.
-            _jwt = jwt.decode(access_token, options=jwt_options)
-            return False
-        except jwt.InvalidTokenError:
-            # Catches ExpiredSignatureError, InvalidTokenError, etc.
-            self.logger.warning(
-                "Código de acesso expirado ou inválido. " \
-                "Um novo token será solicitado..."
-            )
-            return True
+            exp = _decode_exp(access_token)
+            # Same rule as PyJWT's 'verify_exp': expired once 'exp' is reached
+            if exp is None or exp > time.time():
+                return False
+        except ValueError:
+            # Malformed token (bad segments, base64 or JSON)
+            pass
+
+        self.logger.warning(
+            "Código de acesso expirado ou inválido. " \
+            "Um novo token será solicitado..."
+        )
+        return True
 
     def run(self):
         """
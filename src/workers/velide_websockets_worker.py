@@ -1,29 +1,88 @@
 import logging
 import asyncio
-from typing import Dict, Optional
+import random
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import orjson
 from PyQt5.QtCore import QRunnable, QObject, pyqtSignal
 from gql import gql, Client
 from gql.transport.websockets import WebsocketsTransport
 from gql.transport.exceptions import TransportError
+from graphql import ExecutionResult
 from pydantic import ValidationError
 from websockets.exceptions import ConnectionClosedError
 
 # Custom imports
 from config import ApiConfig
+from models.exceptions import SessionExpiredError
 from models.velide_websockets_models import LatestAction
 from services.auth_service import AuthService
 from utils.async_token_provider import AsyncTokenProvider
+from utils.background_loop import get_background_loop, run_in_background_loop
 from utils.connection_state import ConnectionState
 
 
+# Parsed once at import and shared by every worker run
+_SUBSCRIPTION_QUERY = gql("""
+    subscription LatestAction($authorization: String!) {
+        latestAction(authorization: $authorization) {
+            actionType
+            timestamp
+            offset
+            deliveryman {
+                id
+                name
+            }
+            delivery {
+                id
+                routeId
+                createdAt
+                endedAt
+            }
+            route {
+                id
+                deliveries {
+                    id
+                    createdAt
+                }
+            }
+        }
+    }
+""")
+
+
+class _OrjsonWebsocketsTransport(WebsocketsTransport):
+    """
+    WebsocketsTransport that parses incoming frames with orjson instead of
+    the standard library's json module.
+
+    Note: orjson reads integers beyond 64 bits as floats. The subscription
+    only carries ids as strings, dates and small integers (offset).
+    """
+
+    def _parse_answer(
+        self, answer: str
+    ) -> Tuple[str, Optional[int], Optional[ExecutionResult]]:
+        try:
+            json_answer = orjson.loads(answer)
+        except orjson.JSONDecodeError:
+            # Let gql handle (and report) anything orjson rejects
+            return super()._parse_answer(answer)
+
+        if self.subprotocol == self.GRAPHQLWS_SUBPROTOCOL:
+            return self._parse_answer_graphqlws(json_answer)
+
+        return self._parse_answer_apollo(json_answer)
+
+
 class VelideWebsocketsSignals(QObject):
     """
     Defines signals emitted by the VelideWebsocketsWorker.
 
     Signals:
-        action_received (object): Emitted when a new, validated action is
-            received. The payload is the `LatestAction` Pydantic model instance.
+        actions_received (list): Emitted with the validated actions received
+            since the last emission, as `LatestAction` Pydantic model instances
+            in arrival order. Bursts are coalesced into a single emission.
         error_occurred (str): Emitted when a non-recoverable or significant
             error occurs. The payload is the error message.
         connection_closed (str): Emitted when the websocket connection is
@@ -32,7 +91,7 @@ class VelideWebsocketsSignals(QObject):
             connection status changes (CONNECTING, CONNECTED, DISCONNECTED, ERROR).
         finished (None): Emitted when the worker thread completely shuts down.
     """
-    action_received = pyqtSignal(object)
+    actions_received = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
     connection_closed = pyqtSignal(str)
     connection_state_changed = pyqtSignal(ConnectionState)
@@ -44,12 +103,20 @@ class VelideWebsocketsWorker(QRunnable):
     A QRunnable worker that connects to the Velide GraphQL WebSocket server.
     
     Features:
-    - Auto-reconnection with exponential backoff.
+    - Auto-reconnection with exponential backoff (full jitter).
     - Token refreshing via AsyncTokenProvider.
     - Robust error handling for network and protocol issues.
     - Pydantic model validation for incoming data.
     """
 
+    # Shortest wait between connection attempts, in seconds
+    MIN_RETRY_DELAY = 0.1
+
+    # Received actions are emitted together once this many are pending,
+    # or after this window (in seconds) since the first pending one
+    ACTIONS_BATCH_MAX_SIZE = 32
+    ACTIONS_BATCH_WINDOW = 0.01
+
     def __init__(self, api_config: ApiConfig, auth_service: AuthService):
         """
         Initializes the worker.
@@ -75,62 +142,49 @@ class VelideWebsocketsWorker(QRunnable):
         # Control flags
         self._is_running = True
         self._transport: Optional[WebsocketsTransport] = None
+        # Set by stop() to cut a backoff wait short.
+        # Created in the main loop, as it must belong to the event loop.
+        self._stop_event: Optional[asyncio.Event] = None
+
+        # Actions waiting to be emitted, only touched from the event loop
+        self._pending_actions: List[LatestAction] = []
+        self._actions_flush_handle: Optional[asyncio.TimerHandle] = None
         
-        # Retry logic state
+        # Retry logic state. The delay is the cap of the backoff window:
+        # the actual wait is random within it (full jitter), so clients
+        # dropped by the same outage don't all reconnect at once.
         self._retry_delay = 2
 
-        # Pre-compile the query for performance
-        self._subscription_query = gql("""
-            subscription LatestAction($authorization: String!) {
-                latestAction(authorization: $authorization) {
-                    actionType
-                    timestamp
-                    offset
-                    deliveryman {
-                        id
-                        name
-                    }
-                    delivery {
-                        id
-                        routeId
-                        createdAt
-                        endedAt
-                    }
-                    route {
-                        id
-                        deliveries {
-                            id
-                            createdAt
-                        }
-                    }
-                }
-            }
-        """)
-
     def stop(self):
         """
         Thread-safe method to stop the worker.
-        Signals the loop to exit and force-closes the active transport.
+        Wakes the loop up to exit, even while it waits for the next frame,
+        and force-closes the active transport (which may still be connecting).
         """
         self._is_running = False
         self.logger.info("Solicitação de parada do WebSocket recebida.")
-        
+
+        if self._stop_event is not None:
+            get_background_loop().call_soon_threadsafe(self._stop_event.set)
+
         if self._transport:
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.run_coroutine_threadsafe(self._transport.close(), loop)
+                # The transport lives on the shared background loop
+                asyncio.run_coroutine_threadsafe(
+                    self._transport.close(), get_background_loop()
+                )
             except Exception:
                 # Ignore errors during shutdown sequence
                 pass
 
     def run(self):
         """
-        Entry point for the QRunnable. Sets up the asyncio loop.
+        Entry point for the QRunnable. Runs the main loop on the shared
+        background event loop and waits for it to finish.
         """
         try:
             self.logger.debug("Iniciando thread do WebSocket Velide...")
-            asyncio.run(self._run_main_loop())
+            run_in_background_loop(self._run_main_loop())
         except Exception as e:
             self.logger.exception("Falha fatal no WebSocket.")
             self.signals.error_occurred.emit(str(e))
@@ -142,8 +196,21 @@ class VelideWebsocketsWorker(QRunnable):
         """
         The main lifecycle loop. Handles token retrieval, connection attempts,
         and exponential backoff logic.
+
+        The transport and client are created once and reopened on every
+        reconnection, instead of being rebuilt.
         """
         self._retry_delay = 2
+        stop_event = self._stop_event = asyncio.Event()
+
+        # Protocol: graphql-transport-ws
+        self._transport = _OrjsonWebsocketsTransport(
+            url=self.api_config.velide_websockets_server,
+            init_payload={},  # Standard handshake
+            keep_alive_timeout=60,
+            ping_interval=30
+        )
+        client = Client(transport=self._transport, fetch_schema_from_transport=False)
 
         while self._is_running:
             try:
@@ -154,12 +221,12 @@ class VelideWebsocketsWorker(QRunnable):
                 token = await AsyncTokenProvider.get_valid_token(self.auth_service)
 
                 # 3. Connect and Listen
-                await self._subscribe_and_listen(token)
+                await self._subscribe_and_listen(client, token, stop_event)
 
             except (ConnectionClosedError, OSError, asyncio.TimeoutError) as e:
                 self.logger.warning(
                     f"Conexão perdida ou falha na rede ({type(e).__name__}: {e}). "
-                    f"Tentando reconectar em {self._retry_delay}s..."
+                    f"Tentando reconectar em até {self._retry_delay}s..."
                 )
                 self.signals.connection_state_changed.emit(
                     ConnectionState.DISCONNECTED
@@ -176,71 +243,133 @@ class VelideWebsocketsWorker(QRunnable):
                 )
                 # We don't break here; the next loop will fetch a fresh token.
 
+            except SessionExpiredError:
+                # Fatal auth error: stop instead of spamming retries
+                self.logger.exception("Sessão expirada no WebSocket.")
+                self.signals.error_occurred.emit("Sessão expirada. Parando conexões.")
+                self.signals.connection_state_changed.emit(ConnectionState.ERROR)
+                break
+
             except Exception as e:
                 # Critical logic error or unexpected crash
                 error_msg = str(e)
                 self.logger.exception("Erro inesperado no WebSocket.")
-                
-                # Check for fatal auth errors to stop spamming
-                if "Sessão expirada" in error_msg:
-                    self.signals.error_occurred.emit(
-                        "Sessão expirada. Parando conexões."
-                    )
-                    self.signals.connection_state_changed.emit(ConnectionState.ERROR)
-                    break
 
                 self.signals.connection_state_changed.emit(ConnectionState.ERROR)
                 self.signals.error_occurred.emit(f"Erro interno: {error_msg}")
 
-            # Wait before retrying (Exponential Backoff)
+            # Wait before retrying (Exponential Backoff with full jitter),
+            # unless stopped
             if self._is_running:
-                await asyncio.sleep(self._retry_delay)
+                await self._wait_for_stop(
+                    stop_event,
+                    random.uniform(self.MIN_RETRY_DELAY, self._retry_delay)
+                )
                 self._retry_delay = min(self._retry_delay * 2, 60)
         
         # Loop finished cleanly
         self.signals.connection_state_changed.emit(ConnectionState.DISCONNECTED)
 
-    async def _subscribe_and_listen(self, token: str):
+    async def _wait_for_stop(self, stop_event: asyncio.Event, timeout: float):
+        """Sleeps for 'timeout' seconds, returning early if stop() is called."""
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _until_stopped(
+        self, frames: AsyncIterator[Dict[str, Any]], stop_event: asyncio.Event
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields from 'frames' until they end or stop() is called. A stop
+        request doesn't have to wait for the next frame to be noticed.
+        """
+        iterator = frames.__aiter__()
+        stop_requested = asyncio.ensure_future(stop_event.wait())
+        try:
+            while True:
+                next_frame = asyncio.ensure_future(iterator.__anext__())
+                await asyncio.wait(
+                    {next_frame, stop_requested},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not next_frame.done():
+                    # Cancelling ends the subscription, unsubscribing from it
+                    next_frame.cancel()
+                    await asyncio.gather(next_frame, return_exceptions=True)
+                    return
+
+                try:
+                    frame = next_frame.result()
+                except StopAsyncIteration:
+                    return
+                yield frame
+        finally:
+            stop_requested.cancel()
+
+    def _queue_action(self, action: LatestAction):
+        """Adds an action to the next batch, scheduling its emission."""
+        self._pending_actions.append(action)
+        if len(self._pending_actions) >= self.ACTIONS_BATCH_MAX_SIZE:
+            self._flush_actions()
+        elif self._actions_flush_handle is None:
+            self._actions_flush_handle = asyncio.get_running_loop().call_later(
+                self.ACTIONS_BATCH_WINDOW, self._flush_actions
+            )
+
+    def _flush_actions(self):
+        """Emits all pending actions in a single signal."""
+        if self._actions_flush_handle is not None:
+            self._actions_flush_handle.cancel()
+            self._actions_flush_handle = None
+        if self._pending_actions:
+            actions, self._pending_actions = self._pending_actions, []
+            self.signals.actions_received.emit(actions)
+
+    async def _subscribe_and_listen(
+        self, client: Client, token: str, stop_event: asyncio.Event
+    ):
         """
         Establishes the WebSocket connection and processes the subscription stream.
-        
+
         Args:
+            client: The client to connect with. Closed again when this returns.
             token: The valid authorization token.
+            stop_event: Set by stop(), ends the subscription early.
         """
-        # Protocol: graphql-transport-ws
-        self._transport = WebsocketsTransport(
-            url=self.api_config.velide_websockets_server,
-            init_payload={},  # Standard handshake
-            keep_alive_timeout=60,
-            ping_interval=30
-        )
-
         variables: Dict[str, str] = {"authorization": token}
 
-        async with Client(
-            transport=self._transport, fetch_schema_from_transport=False
-        ) as session:
+        async with client as session:
             self.logger.info("Conectado ao Velide.")
             self.signals.connection_state_changed.emit(ConnectionState.CONNECTED)
             
             # CRITICAL: Reset retry delay upon successful connection
             self._retry_delay = 2
 
-            async for data in session.subscribe(
-                self._subscription_query, 
-                variable_values=variables
-            ):
-                if not self._is_running:
-                    break
-                
-                # Safe data extraction
-                action_data = data.get("latestAction")
-                if action_data:
-                    try:
-                        validated_action = LatestAction.model_validate(action_data)
-                        self.signals.action_received.emit(validated_action)
-                    except ValidationError:
-                        self.logger.exception("Erro de validação de dados.")
-                        # We do not disconnect, just log and skip the bad frame
-                    except KeyError:
-                        self.logger.exception("Dados incompletos recebidos no payload.")
\ No newline at end of file
+            try:
+                # parse_result=False: frames are validated by LatestAction,
+                # gql doesn't need to walk them against a schema
+                subscription = session.subscribe(
+                    _SUBSCRIPTION_QUERY, 
+                    variable_values=variables,
+                    parse_result=False,
+                )
+                async for data in self._until_stopped(subscription, stop_event):
+                    # Safe data extraction
+                    action_data = data.get("latestAction")
+                    if action_data:
+                        try:
+                            validated_action = LatestAction.model_validate(
+                                action_data
+                            )
+                            self._queue_action(validated_action)
+                        except ValidationError:
+                            self.logger.exception("Erro de validação de dados.")
+                            # We do not disconnect, just log and skip the bad frame
+                        except KeyError:
+                            self.logger.exception(
+                                "Dados incompletos recebidos no payload."
+                            )
+            finally:
+                # Don't hold back actions received before a disconnection
+                self._flush_actions()
\ No newline at end of file
@@ -1,10 +1,13 @@
 import asyncio
 import logging
+from typing import Any, Awaitable, Callable, ClassVar, Dict
+
 import httpx
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
 from pydantic import ValidationError
 
 from api.velide_gateway import VelideGateway
+from utils.background_loop import run_in_background_loop
 
 # Importing all necessary models and exceptions from both original files
 from models.velide_delivery_models import (
@@ -46,6 +49,11 @@ class VelideWorker(QRunnable):
     to instantiate this worker for the desired task.
     """
 
+    # Read operation -> request in flight. Overlapping workers for the same
+    # read share it instead of each sending their own. Only used from the
+    # background loop.
+    _inflight: ClassVar[Dict[str, "asyncio.Future[Any]"]] = {}
+
     def __init__(self, gateway: VelideGateway, operation: str, **kwargs):
         """
         Private constructor. Please use the @classmethod factory methods.
@@ -85,14 +93,15 @@ class VelideWorker(QRunnable):
         """
         The main work method. This is executed in the QThreadPool.
 
-        It creates a new asyncio event loop to run the async API call
-        and handles all potential errors, emitting the appropriate signals.
+        It runs the async API call on the shared background event loop, where
+        the gateway's pooled HTTP client lives, and handles all potential
+        errors, emitting the appropriate signals.
         """
         self.logger.debug(f"Iniciando tarefa Velide: {self._operation}...")
 
         try:
-            # asyncio.run() creates, runs, and closes the event loop for us.
-            asyncio.run(self._run_async())
+            # Blocks this pool thread until the call completes
+            run_in_background_loop(self._run_async())
 
         # --- Unified Exception Handling ---
 
@@ -181,7 +190,7 @@ class VelideWorker(QRunnable):
                 self.signals.delivery_added.emit(response.model_dump())
 
             elif self._operation == "get_deliverymen":
-                result = await client.get_deliverymen()
+                result = await self._single_flight(client.get_deliverymen)
                 self.logger.info(
                     f"Busca de entregadores concluída. {len(result)} encontrados."
                 )
@@ -198,10 +207,27 @@ class VelideWorker(QRunnable):
 
             elif self._operation == "get_global_snapshot":
                 # Call the new method we added to Velide class
-                result_map = await client.get_active_deliveries_snapshot()
+                result_map = await self._single_flight(
+                    client.get_active_deliveries_snapshot
+                )
                 self.signals.snapshot_retrieved.emit(result_map)
 
             else:
                 raise NotImplementedError(
                     f"Operação desconhecida do VelideWorker: {self._operation}"
                 )
+
+    async def _single_flight(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits 'call', unless the same operation is already in flight,
+        in which case its result (or exception) is shared instead.
+        """
+        future = self._inflight.get(self._operation)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[self._operation] = future
+            future.add_done_callback(
+                lambda _: self._inflight.pop(self._operation, None)
+            )
+        # Shielded, so one waiter being cancelled doesn't cancel the others
+        return await asyncio.shield(future)
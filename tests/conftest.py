@@ -1,5 +1,9 @@
 # tests/conftest.py
+import threading
+from http.server import HTTPServer
+
 import pytest
+from PyQt5.QtCore import QThreadPool
 from services.sqlite_service import SQLiteService
 from services.tracking_persistence_service import TrackingPersistenceService
 from api.sqlite_manager import SQLiteManager
@@ -26,9 +30,51 @@ def persistence_stack(tmp_path, qtbot):
     # to verify that TPS actually wrote to the disk.
     db_manager = SQLiteManager(db_path=db_path_str)
 
-    return {
+    yield {
         "tps": tps,
         "sqlite": sqlite_service,
         "db_manager": db_manager,
         "db_path": db_path_str,
     }
+
+    # Let in-flight tasks finish, then close the pooled connections so
+    # the temp DB isn't left open
+    QThreadPool.globalInstance().waitForDone(2000)
+    sqlite_service.close()
+
+
+@pytest.fixture
+def thread_pool():
+    """
+    The global QThreadPool, with at least 4 threads whatever the CPU count,
+    so tests of concurrent tasks don't run them one after another.
+    """
+    pool = QThreadPool.globalInstance()
+    max_threads = pool.maxThreadCount()
+    pool.setMaxThreadCount(max(max_threads, 4))
+    yield pool
+    pool.setMaxThreadCount(max_threads)
+
+
+@pytest.fixture
+def local_oauth_server(request):
+    """
+    Serves 'handler_class' on a local HTTP port and routes it through
+    'session''s HTTPS adapter. Parametrize it indirectly with
+    (handler_class, session); yields the server's URL prefix.
+
+    The handler class's 'requests_received' counter is reset first.
+    """
+    handler_class, session = request.param
+    handler_class.requests_received = 0
+    server = HTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    prefix = f"http://127.0.0.1:{server.server_port}"
+    # Route the plain-HTTP test server through the same retrying adapter
+    # the session uses for the real (HTTPS) authorization server.
+    session.mount(prefix, session.get_adapter("https://"))
+    yield prefix
+    del session.adapters[prefix]
+    server.shutdown()
+    server.server_close()
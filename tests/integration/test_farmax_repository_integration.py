@@ -2,108 +2,130 @@ import pytest
 import sqlite3
 from datetime import time, date
 from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
 
 from connectors.farmax.farmax_repository import FarmaxRepository
 from models.farmax_models import FarmaxDeliveryman
 
-# SQLite doesn't support datetime.time objects natively.
-# We register an adapter to convert them to ISO format strings (HH:MM:SS) automatically.
-sqlite3.register_adapter(time, lambda t: t.isoformat())
 
+@pytest.fixture(scope="module", autouse=True)
+def _register_time_adapter():
+    # SQLite doesn't support datetime.time objects natively.
+    # We register an adapter to convert them to ISO format strings (HH:MM:SS)
+    # automatically, only while this module's tests run.
+    sqlite3.register_adapter(time, time.isoformat)
+    yield
+    sqlite3.adapters.pop((time, sqlite3.PrepareProtocol), None)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def db_engine():
-    engine = create_engine("sqlite:///:memory:")
+    # A single engine (and in-memory connection) for the whole session.
+    # The repository commits its own transactions, so tests are isolated by
+    # setup_database restoring the seeded database instead of a rollback.
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
     with engine.connect() as conn:
         conn.execute(text("PRAGMA foreign_keys=ON"))
-    return engine
+    yield engine
+    engine.dispose()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def repository(db_engine):
+    # Holds no state besides the engine, so one instance serves every test.
     return FarmaxRepository(db_engine)
 
 
+# Schema and seed data. Built once per session in _seeded_template.
+SEED_STATEMENTS = [
+    # Tables
+    (
+        "CREATE TABLE ENTREGAS "
+        "(CD_VENDA REAL PRIMARY KEY, CD_ENTREGADOR REAL, CD_CLIENTE REAL, " \
+        "NOME TEXT, BAIRRO TEXT, DATA TEXT, HORA_SAIDA TEXT, " \
+        "HORA_CHEGADA TEXT, STATUS TEXT)"
+    ),
+    (
+        "CREATE TABLE VENDAS "
+        "('RDB$DB_KEY' INTEGER PRIMARY KEY AUTOINCREMENT, CD_VENDA REAL, " \
+        "CD_PRODUTO REAL, DESCRICAO TEXT, HORA TEXT, TEMPENDERECO TEXT, " \
+        "TEMPREFERENCIA TEXT, STATUS TEXT, CONCLUIDO TEXT, HORAFINAL TEXT)"
+    ),
+    (
+        "CREATE TABLE CLIENTES "
+        "(CD_CLIENTE REAL PRIMARY KEY, NOME TEXT, FONE TEXT)"
+    ),
+    (
+        "CREATE TABLE VENDEDORES "
+        "(CD_VENDEDOR REAL PRIMARY KEY, NOME TEXT, TIPO_FUNCIONARIO TEXT)"
+    ),
+
+    # Data Injection (Sanitized from your CSVs)
+    # Note: Dates are ISO format for SQLite compatibility
+    (
+        "INSERT INTO VENDAS "
+        "(CD_VENDA, CD_PRODUTO, DESCRICAO, HORA, " \
+        "TEMPENDERECO, TEMPREFERENCIA, STATUS) " \
+        "VALUES "
+        "(562083.0, 114830.0, 'ORLISTATE', " \
+        "'08:26:07.000', 'RUA BIOLOGOS', 'QDR 70', 'V')"
+    ),
+    (
+        "INSERT INTO VENDAS "
+        "(CD_VENDA, CD_PRODUTO, DESCRICAO, HORA, TEMPENDERECO, " \
+        "TEMPREFERENCIA, STATUS) " \
+        "VALUES "
+        "(562083.0, 119137.0, 'VAGISIL', '08:26:07.000', " \
+        "'RUA BIOLOGOS', 'QDR 70', 'V')"
+    ),
+
+    # Insert Delivery (Date converted to YYYY-MM-DD)
+    (
+        "INSERT INTO ENTREGAS "
+        "(CD_VENDA, CD_CLIENTE, CD_ENTREGADOR, NOME, " \
+        "BAIRRO, STATUS, HORA_SAIDA, DATA) " \
+        "VALUES "
+        "(562083.0, 1014113.0, 750.0, 'FABI', " \
+        "'TAQUARA', 'S', NULL, '2024-03-14')"
+    ),
+
+    (
+        "INSERT INTO CLIENTES (CD_CLIENTE, NOME, FONE) " \
+        "VALUES (1014113.0, 'FABI', '996458722')"
+    ),
+    (
+        "INSERT INTO VENDEDORES (CD_VENDEDOR, NOME, TIPO_FUNCIONARIO) " \
+        "VALUES (870.0, 'RODRIGO NUNES', 'E'), (444.0, 'MARCIO DA SILVA', 'E')"
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def _seeded_template():
+    """Seeded in-memory database, copied into each test's database."""
+    conn = sqlite3.connect(":memory:")
+    # One call for the whole seed, in a single transaction
+    conn.executescript(
+        "BEGIN;\n" + ";\n".join(SEED_STATEMENTS) + ";\nCOMMIT;"
+    )
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
-def setup_database(db_engine):
-    with db_engine.begin() as conn:
-        # Tables
-        conn.execute(
-            text(
-                "CREATE TABLE ENTREGAS "
-                "(CD_VENDA REAL PRIMARY KEY, CD_ENTREGADOR REAL, CD_CLIENTE REAL, " \
-                "NOME TEXT, BAIRRO TEXT, DATA TEXT, HORA_SAIDA TEXT, " \
-                "HORA_CHEGADA TEXT, STATUS TEXT)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE TABLE VENDAS "
-                "('RDB$DB_KEY' INTEGER PRIMARY KEY AUTOINCREMENT, CD_VENDA REAL, " \
-                "CD_PRODUTO REAL, DESCRICAO TEXT, HORA TEXT, TEMPENDERECO TEXT, " \
-                "TEMPREFERENCIA TEXT, STATUS TEXT, CONCLUIDO TEXT, HORAFINAL TEXT)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE TABLE CLIENTES "
-                "(CD_CLIENTE REAL PRIMARY KEY, NOME TEXT, FONE TEXT)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE TABLE VENDEDORES "
-                "(CD_VENDEDOR REAL PRIMARY KEY, NOME TEXT, TIPO_FUNCIONARIO TEXT)"
-            )
-        )
-
-        # Data Injection (Sanitized from your CSVs)
-        # Note: Dates are ISO format for SQLite compatibility
-        conn.execute(
-            text(
-                "INSERT INTO VENDAS "
-                "(CD_VENDA, CD_PRODUTO, DESCRICAO, HORA, " \
-                "TEMPENDERECO, TEMPREFERENCIA, STATUS) " \
-                "VALUES "
-                "(562083.0, 114830.0, 'ORLISTATE', " \
-                "'08:26:07.000', 'RUA BIOLOGOS', 'QDR 70', 'V')"
-            )
-        )
-        conn.execute(
-            text(
-                "INSERT INTO VENDAS "
-                "(CD_VENDA, CD_PRODUTO, DESCRICAO, HORA, TEMPENDERECO, " \
-                "TEMPREFERENCIA, STATUS) " \
-                "VALUES "
-                "(562083.0, 119137.0, 'VAGISIL', '08:26:07.000', " \
-                "'RUA BIOLOGOS', 'QDR 70', 'V')"
-            )
-        )
-
-        # Insert Delivery (Date converted to YYYY-MM-DD)
-        conn.execute(
-            text(
-                "INSERT INTO ENTREGAS "
-                "(CD_VENDA, CD_CLIENTE, CD_ENTREGADOR, NOME, " \
-                "BAIRRO, STATUS, HORA_SAIDA, DATA) " \
-                "VALUES "
-                "(562083.0, 1014113.0, 750.0, 'FABI', " \
-                "'TAQUARA', 'S', NULL, '2024-03-14')"
-            )
-        )
-
-        conn.execute(
-            text(
-                "INSERT INTO CLIENTES (CD_CLIENTE, NOME, FONE) " \
-                "VALUES (1014113.0, 'FABI', '996458722')"
-            )
-        )
-        conn.execute(
-            text(
-                "INSERT INTO VENDEDORES (CD_VENDEDOR, NOME, TIPO_FUNCIONARIO) " \
-                "VALUES (870.0, 'RODRIGO NUNES', 'E'), (444.0, 'MARCIO DA SILVA', 'E')"
-            )
-        )
+def setup_database(db_engine, _seeded_template):
+    # Copies the seeded pages in one call, instead of running the DDL and
+    # inserts for every test. It replaces the whole database, undoing any
+    # changes made by the previous test.
+    raw = db_engine.raw_connection()
+    try:
+        _seeded_template.backup(raw.driver_connection)
+    finally:
+        raw.close()
 
 
 # ==========================================
@@ -127,6 +149,12 @@ def test_fetch_deliveries_empty_list(repository, setup_database):
     assert repository.fetch_deliveries_by_id([]) == []
 
 
+SELECT_STATUS_AND_DELIVERYMAN = text(
+    "SELECT STATUS, CD_ENTREGADOR FROM ENTREGAS WHERE CD_VENDA = :id"
+)
+SELECT_STATUS = text("SELECT STATUS FROM ENTREGAS WHERE CD_VENDA = :id")
+
+
 def test_lifecycle_update_status(repository, setup_database, db_engine):
     # 1. Fetch & Verify Initial
     delivery = repository.fetch_deliveries_by_id((562083.0,))[0]
@@ -138,7 +166,7 @@ def test_lifecycle_update_status(repository, setup_database, db_engine):
     # Verify DB
     with db_engine.connect() as conn:
         row = conn.execute(
-            text("SELECT STATUS, CD_ENTREGADOR FROM ENTREGAS WHERE CD_VENDA = 562083.0")
+            SELECT_STATUS_AND_DELIVERYMAN, {"id": 562083.0}
         ).fetchone()
         assert row.STATUS == "R"
         assert row.CD_ENTREGADOR == 870.0
@@ -149,7 +177,7 @@ def test_lifecycle_update_status(repository, setup_database, db_engine):
     # Verify DB
     with db_engine.connect() as conn:
         row = conn.execute(
-            text("SELECT STATUS FROM ENTREGAS WHERE CD_VENDA = 562083.0")
+            SELECT_STATUS, {"id": 562083.0}
         ).fetchone()
         assert row.STATUS == "V"
 
@@ -72,3 +72,129 @@ class TestPersistenceIntegration:
         # --- ASSERT ---
         # Data should now be in the in-memory cache
         assert tps.get_current_status("100") == DeliveryStatus.PENDING
+
+    def test_burst_of_new_deliveries_is_written_as_one_batch(
+        self, persistence_stack, qtbot
+    ):
+        """
+        Tests that deliveries registered in quick succession are persisted
+        together, reporting a single add_delivery_result.
+        """
+        # --- ARRANGE ---
+        tps = persistence_stack["tps"]
+        sqlite_service = persistence_stack["sqlite"]
+        db_manager = persistence_stack["db_manager"]
+        results = []
+        sqlite_service.add_delivery_result.connect(results.append)
+
+        # --- ACT ---
+        with qtbot.waitSignal(sqlite_service.add_delivery_result, timeout=2000):
+            for i in range(3):
+                tps.register_new_delivery(
+                    internal_id=str(i),
+                    external_id=f"UUID-{i}",
+                    status=DeliveryStatus.ADDED,
+                )
+
+        # --- ASSERT ---
+        assert results == [True]
+        with db_manager as db:
+            rows = db.get_all_deliveries()
+
+        assert sorted(rows) == [
+            (f"UUID-{i}", str(i), DeliveryStatus.ADDED) for i in range(3)
+        ]
+
+    def test_repeated_id_lookup_is_served_from_cache(self, persistence_stack, qtbot):
+        """
+        Tests that a deliveryman ID already looked up is answered again
+        without a database task, and that a mapping write forgets it.
+        """
+        # --- ARRANGE ---
+        sqlite_service = persistence_stack["sqlite"]
+        db_manager = persistence_stack["db_manager"]
+        with db_manager as db:
+            db.add_mapping("VELIDE-1", "LOCAL-1")
+
+        with qtbot.waitSignal(sqlite_service.local_id_found, timeout=2000) as blocker:
+            sqlite_service.request_get_local_id("VELIDE-1")
+        assert blocker.args == ["LOCAL-1"]
+
+        # --- ACT ---
+        # Removed behind the service's back: only a cached answer finds it
+        with db_manager as db:
+            db.delete_mapping_by_velide_id("VELIDE-1")
+
+        with qtbot.waitSignal(sqlite_service.local_id_found, timeout=2000) as blocker:
+            sqlite_service.request_get_local_id("VELIDE-1")
+
+        # --- ASSERT ---
+        assert blocker.args == ["LOCAL-1"]
+
+        sqlite_service.request_delete_mapping("VELIDE-1")
+        assert sqlite_service._local_id_cache == {}
+
+    def test_status_update_right_after_add_is_kept(
+        self, persistence_stack, thread_pool, qtbot
+    ):
+        """
+        Tests that a status update requested right after an add is
+        written after it, so the update isn't lost.
+        """
+        # --- ARRANGE ---
+        tps = persistence_stack["tps"]
+        sqlite_service = persistence_stack["sqlite"]
+        db_manager = persistence_stack["db_manager"]
+        results = []
+        sqlite_service.update_status_result.connect(results.append)
+
+        # --- ACT ---
+        for i in range(10):
+            tps.register_new_delivery(
+                internal_id=str(i),
+                external_id=f"UUID-{i}",
+                status=DeliveryStatus.ADDED,
+            )
+            tps.update_status(str(i), DeliveryStatus.IN_PROGRESS)
+
+        qtbot.waitUntil(lambda: len(results) == 10, timeout=2000)
+
+        # --- ASSERT ---
+        assert results == [True] * 10
+        with db_manager as db:
+            rows = db.get_all_deliveries()
+
+        assert sorted(rows) == [
+            (f"UUID-{i}", str(i), DeliveryStatus.IN_PROGRESS) for i in range(10)
+        ]
+
+    def test_drain_writes_persists_queued_writes_without_event_loop(
+        self, persistence_stack, thread_pool
+    ):
+        """
+        Tests that drain_writes() writes everything buffered or queued
+        even though the event loop never runs again, as on shutdown.
+        """
+        # --- ARRANGE ---
+        tps = persistence_stack["tps"]
+        sqlite_service = persistence_stack["sqlite"]
+        db_manager = persistence_stack["db_manager"]
+
+        for i in range(10):
+            tps.register_new_delivery(
+                internal_id=str(i),
+                external_id=f"UUID-{i}",
+                status=DeliveryStatus.ADDED,
+            )
+            tps.update_status(str(i), DeliveryStatus.IN_PROGRESS)
+
+        # --- ACT ---
+        sqlite_service.drain_writes()
+
+        # --- ASSERT ---
+        with db_manager as db:
+            rows = db.get_all_deliveries()
+
+        assert sorted(rows) == [
+            (f"UUID-{i}", str(i), DeliveryStatus.IN_PROGRESS) for i in range(10)
+        ]
@@ -0,0 +1,43 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from utils.access_token import AccessToken, TokenPollingState
+from utils.oauth_session import oauth_polling_session
+
+
+class _SlowDownHandler(BaseHTTPRequestHandler):
+    """Answers every token request as Auth0 does when polled too often."""
+
+    requests_received = 0
+
+    def do_POST(self):
+        type(self).requests_received += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"error": "slow_down"}).encode()
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", "5")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.mark.parametrize(
+    "local_oauth_server",
+    [(_SlowDownHandler, oauth_polling_session)],
+    indirect=True,
+)
+def test_slow_down_is_returned_without_retrying(local_oauth_server):
+    handler = AccessToken(domain="example.com", client_id="client", device_code="code")
+    handler.url = f"{local_oauth_server}/oauth/token"
+
+    result = handler.try_request()
+
+    assert result is TokenPollingState.SLOW_DOWN
+    assert handler.retry_after == 5
+    assert _SlowDownHandler.requests_received == 1
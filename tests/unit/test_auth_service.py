@@ -0,0 +1,104 @@
+import asyncio
+import gc
+import threading
+import time
+
+import jwt
+import pytest
+from unittest.mock import MagicMock, patch
+
+from models.exceptions import SessionExpiredError
+from services.auth_service import AuthService
+from utils.async_token_provider import AsyncTokenProvider
+from utils.device_code import DeviceCodeInfo
+from workers.authorization_flow_worker import AuthorizationFlowWorker
+
+
+@pytest.fixture
+def auth_service(qtbot):
+    return AuthService(MagicMock(), MagicMock())
+
+
+def make_token(expires_in: float) -> str:
+    return jwt.encode({"exp": int(time.time() + expires_in)}, "s" * 32)
+
+
+def test_received_token_is_cached(auth_service):
+    token = make_token(3600)
+
+    auth_service._on_access_token_received(token, "refresh")
+
+    assert auth_service.get_cached_access_token() == token
+    assert auth_service._refresh_timer.isActive()
+
+
+def test_token_close_to_expiry_is_not_cached(auth_service):
+    auth_service._current_access_token = (make_token(10), int(time.time() + 10))
+
+    assert auth_service.get_cached_access_token() is None
+
+
+def test_unreadable_token_is_not_cached(auth_service):
+    auth_service._on_access_token_received("not-a-jwt", "refresh")
+
+    assert auth_service.get_cached_access_token() is None
+    assert not auth_service._refresh_timer.isActive()
+
+
+def test_refresh_failure_is_raised_as_session_expired():
+    loop = asyncio.new_event_loop()
+    try:
+        future = loop.create_future()
+        receiver = AsyncTokenProvider._SignalReceiver(loop, future)
+
+        receiver.on_error(AuthService.SESSION_EXPIRED_TITLE, "invalid_grant")
+        loop.run_until_complete(asyncio.sleep(0))
+
+        assert isinstance(future.exception(), SessionExpiredError)
+    finally:
+        loop.close()
+
+
+def test_overlapping_device_flows_still_authenticate(auth_service, thread_pool, qtbot):
+    token = make_token(3600)
+    release_code = threading.Event()
+    code_info = DeviceCodeInfo(
+        device_code="device",
+        user_code="USER",
+        verification_uri="https://example.com",
+        verification_uri_complete="https://example.com?code=USER",
+        expires_in=60,
+        interval=0,
+    )
+
+    def request_code():
+        # Held until the second flow has joined this request
+        release_code.wait(2)
+        return code_info
+
+    module = "workers.authorization_flow_worker"
+    with patch(f"{module}.DeviceCode") as device_code, \
+            patch(f"{module}.AccessToken") as access_token, \
+            patch(f"{module}.store_token_at_file"):
+        device_code.return_value.request.side_effect = request_code
+        access_token.return_value.try_request.return_value = {
+            "access_token": token,
+            "refresh_token": "refresh",
+        }
+
+        # A double-click: the second flow joins the first one's request
+        auth_service.load_device_flow()
+        qtbot.waitUntil(
+            lambda: AuthorizationFlowWorker._inflight_future is not None
+        )
+        auth_service.load_device_flow()
+        qtbot.wait(100)
+
+        with qtbot.waitSignal(auth_service.access_token, timeout=2000) as blocker:
+            release_code.set()
+            # Only the first flow polls; it must not be collected
+            gc.collect()
+
+    assert blocker.args == [token]
+    assert device_code.return_value.request.call_count == 1
+    qtbot.waitUntil(lambda: auth_service._authorization_flow_workers == {})
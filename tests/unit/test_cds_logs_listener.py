@@ -0,0 +1,181 @@
+import json
+import os
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from workers.cds_logs_listener_worker import CdsLogsListenerWorker, _NewFileHandler
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def signals():
+    """Mocks the CdsLogsListenerSignals object."""
+    return MagicMock()
+
+
+@pytest.fixture
+def handler(signals):
+    handler = _NewFileHandler(signals)
+    # Files written by the tests are complete, skip the age check.
+    handler.MIN_FILE_AGE_SECONDS = 0
+    yield handler
+    if handler._timer is not None:
+        handler._timer.cancel()
+
+
+def write_order(folder, name, content):
+    path = os.path.join(str(folder), name)
+    with open(path, "w", encoding="windows-1252") as f:
+        json.dump(content, f)
+    return path
+
+
+def created_event(path, is_directory=False):
+    event = MagicMock()
+    event.src_path = path
+    event.is_directory = is_directory
+    return event
+
+
+# --- Tests ---
+
+
+def test_ignores_non_matching_files(handler, signals, tmp_path):
+    path = write_order(tmp_path, "other.json", {"id": 1})
+
+    handler.on_created(created_event(path))
+
+    assert handler._pending == {}
+    assert handler._timer is None
+
+
+def test_only_the_file_name_is_matched(handler, tmp_path):
+    folder = tmp_path / "ent_logs"
+    folder.mkdir()
+    path = write_order(folder, "other.json", {"id": 1})
+
+    handler.on_created(created_event(path))
+
+    assert handler._pending == {}
+
+
+def test_burst_is_emitted_as_single_deduplicated_batch(handler, signals, tmp_path):
+    first = write_order(tmp_path, "ent001.json", {"id": 1})
+    second = write_order(tmp_path, "ent002.json", {"id": 2})
+    # Make the processing order deterministic (oldest first)
+    os.utime(first, (time.time() - 10, time.time() - 10))
+
+    handler.on_created(created_event(first))
+    handler.on_created(created_event(second))
+    handler.on_created(created_event(first))  # Duplicate event
+    handler.flush()
+
+    signals.new_order.emit.assert_called_once_with([{"id": 1}, {"id": 2}])
+
+
+def test_invalid_json_is_skipped(handler, signals, tmp_path):
+    valid = write_order(tmp_path, "ent001.json", {"id": 1})
+    invalid = os.path.join(str(tmp_path), "ent002.json")
+    with open(invalid, "w") as f:
+        f.write("{not json")
+
+    handler.on_created(created_event(valid))
+    handler.on_created(created_event(invalid))
+    handler.flush()
+
+    signals.new_order.emit.assert_called_once_with([{"id": 1}])
+
+
+def test_recent_files_are_requeued(handler, signals, tmp_path):
+    handler.MIN_FILE_AGE_SECONDS = 60
+    path = write_order(tmp_path, "ent001.json", {"id": 1})
+
+    handler.on_created(created_event(path))
+    handler.flush()
+
+    signals.new_order.emit.assert_not_called()
+    assert path in handler._pending
+
+
+def test_already_processed_file_is_not_emitted_again(handler, signals, tmp_path):
+    path = write_order(tmp_path, "ent001.json", {"id": 1})
+
+    handler.on_created(created_event(path))
+    handler.flush()
+    handler.on_created(created_event(path))  # Same file reported again
+    handler.flush()
+
+    signals.new_order.emit.assert_called_once_with([{"id": 1}])
+
+
+def test_windows_1252_files_are_decoded(handler, signals, tmp_path):
+    path = os.path.join(str(tmp_path), "ent001.json")
+    with open(path, "w", encoding="windows-1252") as f:
+        json.dump({"nome": "João"}, f, ensure_ascii=False)
+
+    handler.on_created(created_event(path))
+    handler.flush()
+
+    signals.new_order.emit.assert_called_once_with([{"nome": "João"}])
+
+
+def test_empty_file_is_skipped(handler, signals, tmp_path):
+    path = os.path.join(str(tmp_path), "ent001.json")
+    open(path, "w").close()
+
+    handler.on_created(created_event(path))
+    handler.flush()
+
+    signals.new_order.emit.assert_not_called()
+
+
+def test_existing_files_written_since_timestamp_are_enqueued(handler, tmp_path):
+    old = write_order(tmp_path, "ent001.json", {"id": 1})
+    os.utime(old, (time.time() - 60, time.time() - 60))
+    recent = write_order(tmp_path, "ent002.json", {"id": 2})
+    write_order(tmp_path, "other.json", {"id": 3})
+    (tmp_path / "ent003.json").mkdir()
+
+    worker = CdsLogsListenerWorker(str(tmp_path))
+    worker._event_handler = handler
+    worker._enqueue_existing_files(time.time_ns() - 30_000_000_000)
+
+    assert list(handler._pending) == [recent]
+
+
+def test_flush_saves_the_newest_processed_mtime(signals, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.txt")
+    handler = _NewFileHandler(signals, checkpoint_path=checkpoint)
+    handler.MIN_FILE_AGE_SECONDS = 0
+    first = write_order(tmp_path, "ent001.json", {"id": 1})
+    second = write_order(tmp_path, "ent002.json", {"id": 2})
+    os.utime(first, (time.time() - 10, time.time() - 10))
+
+    handler._enqueue([first, second])
+    handler.flush()
+
+    with open(checkpoint) as f:
+        assert int(f.read()) == os.stat(second).st_mtime_ns
+
+
+def test_startup_scan_resumes_after_the_saved_checkpoint(handler, tmp_path):
+    processed = write_order(tmp_path, "ent001.json", {"id": 1})
+    os.utime(processed, (time.time() - 120, time.time() - 120))
+    # Written while the app was closed, before this process started
+    missed = write_order(tmp_path, "ent002.json", {"id": 2})
+    os.utime(missed, (time.time() - 60, time.time() - 60))
+    checkpoint = tmp_path / "checkpoint.txt"
+    checkpoint.write_text(str(os.stat(processed).st_mtime_ns))
+
+    worker = CdsLogsListenerWorker(
+        str(tmp_path),
+        process_files_since=time.time(),
+        checkpoint_path=str(checkpoint),
+    )
+    worker._event_handler = handler
+    worker._enqueue_existing_files(worker._scan_start_ns())
+
+    assert list(handler._pending) == [missed]
@@ -23,12 +23,12 @@ from config import ApiConfig, ReconciliationConfig, TargetSystem
 
 # --- Helpers ---
 
-def create_test_order(customer_name="John Doe", address="123 Main St"):
+def create_test_order(customer_name="John Doe", address="123 Main St", created_at=None):
     """Helper to create a test order with required fields."""
     return Order(
         customerName=customer_name,
         address=address,
-        createdAt=datetime.now(timezone.utc),
+        createdAt=created_at or datetime.now(timezone.utc),
         internal_id="TEST-001",
         customerContact=None,
         reference=None,
@@ -42,7 +42,8 @@ def create_test_delivery(
     delivery_id="velide-123",
     street="123 Main St",
     housenumber="",
-    customer_name="John Doe"
+    customer_name="John Doe",
+    created_at=None
 ):
     """
     Helper to create a test delivery response.
@@ -50,7 +51,7 @@ def create_test_delivery(
     """
     return DeliveryResponse(
         id=delivery_id,
-        createdAt=datetime.now(timezone.utc),
+        createdAt=created_at or datetime.now(timezone.utc),
         routeId=None,
         endedAt=None,
         location=Location(
@@ -110,8 +111,10 @@ class TestDeliveryReconciliationStrategyCheckExists:
         client._client = AsyncMock()
         return client
 
-    @pytest.fixture
-    def config(self):
+    # Read-only inputs: built once and shared by the class's tests.
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
         """Create test configuration."""
         return ReconciliationConfig(
             retry_reconciliation_enabled=True,
@@ -119,23 +122,32 @@ class TestDeliveryReconciliationStrategyCheckExists:
             retry_reconciliation_time_window_seconds=300.0
         )
 
-    @pytest.fixture
-    def order(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def order(cls):
         """Create a test order."""
         return create_test_order()
 
-    @pytest.fixture
-    def existing_delivery(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def existing_delivery(cls):
         """Create an existing delivery response."""
         return create_test_delivery()
 
-    @pytest.mark.asyncio
-    async def test_check_exists_finds_matching_delivery(self, mock_velide, config, order, existing_delivery):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def snapshot_with_delivery(cls, existing_delivery):
+        """Create a snapshot holding only the existing delivery."""
+        return create_snapshot([existing_delivery])
+
+    async def test_check_exists_finds_matching_delivery(
+        self, mock_velide, config, order, snapshot_with_delivery
+    ):
         """
         Verify that check_exists finds a delivery matching the customer name and address.
         """
         # Arrange
-        mock_velide.get_full_global_snapshot.return_value = create_snapshot([existing_delivery])
+        mock_velide.get_full_global_snapshot.return_value = snapshot_with_delivery
         strategy = DeliveryReconciliationStrategy(mock_velide, config)
 
         # Act
@@ -146,7 +158,6 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result.id == "velide-123"
         mock_velide.get_full_global_snapshot.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_check_exists_returns_none_when_no_match(self, mock_velide, config, order):
         """
         Verify that check_exists returns None when no matching delivery exists.
@@ -162,7 +173,6 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result is None
         mock_velide.get_full_global_snapshot.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_check_exists_handles_exception(self, mock_velide, config, order):
         """
         Verify that check_exists returns None on API error (swallows error to allow retry).
@@ -177,13 +187,14 @@ class TestDeliveryReconciliationStrategyCheckExists:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_extracts_order_from_args(self, mock_velide, config, order, existing_delivery):
+    async def test_extracts_order_from_args(
+        self, mock_velide, config, order, snapshot_with_delivery
+    ):
         """
         Verify that check_exists extracts the Order from positional args.
         """
         # Arrange
-        mock_velide.get_full_global_snapshot.return_value = create_snapshot([existing_delivery])
+        mock_velide.get_full_global_snapshot.return_value = snapshot_with_delivery
         strategy = DeliveryReconciliationStrategy(mock_velide, config)
 
         # Act - pass order as first positional arg
@@ -193,13 +204,14 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result is not None
         assert result.id == "velide-123"
 
-    @pytest.mark.asyncio
-    async def test_extracts_order_from_kwargs(self, mock_velide, config, order, existing_delivery):
+    async def test_extracts_order_from_kwargs(
+        self, mock_velide, config, order, snapshot_with_delivery
+    ):
         """
         Verify that check_exists extracts the Order from keyword args.
         """
         # Arrange
-        mock_velide.get_full_global_snapshot.return_value = create_snapshot([existing_delivery])
+        mock_velide.get_full_global_snapshot.return_value = snapshot_with_delivery
         strategy = DeliveryReconciliationStrategy(mock_velide, config)
 
         # Act - pass order as keyword arg
@@ -209,7 +221,6 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result is not None
         assert result.id == "velide-123"
 
-    @pytest.mark.asyncio
     async def test_returns_none_when_no_order_in_args(self, mock_velide, config):
         """
         Verify that check_exists returns None when no Order is found in arguments.
@@ -224,13 +235,14 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result is None
         mock_velide.get_full_global_snapshot.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_prefers_args_over_kwargs(self, mock_velide, config, order, existing_delivery):
+    async def test_prefers_args_over_kwargs(
+        self, mock_velide, config, order, snapshot_with_delivery
+    ):
         """
         Verify that positional args are preferred over kwargs when both contain Order.
         """
         # Arrange
-        mock_velide.get_full_global_snapshot.return_value = create_snapshot([existing_delivery])
+        mock_velide.get_full_global_snapshot.return_value = snapshot_with_delivery
         strategy = DeliveryReconciliationStrategy(mock_velide, config)
 
         different_order = create_test_order(customer_name="Jane Doe", address="456 Oak Ave")
@@ -244,7 +256,6 @@ class TestDeliveryReconciliationStrategyCheckExists:
         assert result.metadata is not None
         assert result.metadata.customer_name == "John Doe"
 
-    @pytest.mark.asyncio
     async def test_reconciliation_receives_clean_arguments(self, velide_real_instance, order):
         """
         Verifies that 'self' is stripped from args before calling reconciliation.
@@ -271,53 +282,33 @@ class TestDeliveryReconciliationStrategyCheckExists:
 class TestDeliveryReconciliationStrategyAddressMatching:
     """Test the internal _address_matches logic."""
 
-    @pytest.fixture
-    def mock_velide(self):
-        return MagicMock()
-
-    @pytest.fixture
-    def config(self):
-        return ReconciliationConfig(retry_reconciliation_enabled=True)
-
-    def test_addresses_match_exact(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="123 Main St")
-        assert strategy._address_matches(meta, "123 Main St") is True
-
-    def test_addresses_match_substring(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="123 Main St, Apt 4")
-        # "123 Main St" is inside "123 Main St, Apt 4"
-        assert strategy._address_matches(meta, "123 Main St") is True
-
-    def test_addresses_match_reverse_substring(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="123 Main St")
-        # "123 Main St" is inside "123 Main St, Apt 4"
-        assert strategy._address_matches(meta, "123 Main St, Apt 4") is True
-
-    def test_addresses_match_case_insensitive(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="123 MAIN ST")
-        assert strategy._address_matches(meta, "123 main st") is True
-
-    def test_addresses_no_match(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="123 Main St")
-        assert strategy._address_matches(meta, "456 Oak Ave") is False
-
-    def test_addresses_match_rejects_short_strings(self, mock_velide, config):
-        """Prevent matches on very short inputs like '10' matching '100 Street'"""
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address="100 Main St")
-        
-        # '10' is theoretically in '100 Main St', but should be rejected for length < 5
-        assert strategy._address_matches(meta, "10") is False
-
-    def test_addresses_match_empty_metadata(self, mock_velide, config):
-        strategy = DeliveryReconciliationStrategy(mock_velide, config)
-        meta = MetadataResponse(address=None)
-        assert strategy._address_matches(meta, "123 Main St") is False
+    @pytest.fixture(scope="class")
+    @classmethod
+    def strategy(cls):
+        # _address_matches is pure, so one strategy serves every case.
+        config = ReconciliationConfig(retry_reconciliation_enabled=True)
+        return DeliveryReconciliationStrategy(MagicMock(), config)
+
+    @pytest.mark.parametrize(
+        "stored_address, input_address, expected",
+        [
+            pytest.param("123 Main St", "123 Main St", True, id="exact"),
+            # "123 Main St" is inside "123 Main St, Apt 4"
+            pytest.param("123 Main St, Apt 4", "123 Main St", True, id="substring"),
+            pytest.param(
+                "123 Main St", "123 Main St, Apt 4", True, id="reverse_substring"
+            ),
+            pytest.param("123 MAIN ST", "123 main st", True, id="case_insensitive"),
+            pytest.param("123 Main St", "456 Oak Ave", False, id="no_match"),
+            # '10' is theoretically in '100 Main St', but should be rejected
+            # for length < 5
+            pytest.param("100 Main St", "10", False, id="rejects_short_strings"),
+            pytest.param(None, "123 Main St", False, id="empty_metadata"),
+        ],
+    )
+    def test_address_matches(self, strategy, stored_address, input_address, expected):
+        meta = MetadataResponse(address=stored_address)
+        assert strategy._address_matches(meta, input_address) is expected
 
 
 class TestDeliveryReconciliationStrategyProperties:
@@ -355,14 +346,14 @@ class TestDeliveryReconciliationStrategyMatchingLogic:
         mock.get_full_global_snapshot = AsyncMock()
         return mock
 
-    @pytest.fixture
-    def config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
         return ReconciliationConfig(
             retry_reconciliation_enabled=True,
             retry_reconciliation_time_window_seconds=300.0  # 5 minutes
         )
 
-    @pytest.mark.asyncio
     async def test_ignores_delivery_outside_time_window(self, mock_velide, config):
         """
         Verify that a delivery matching name and address is ignored 
@@ -376,10 +367,9 @@ class TestDeliveryReconciliationStrategyMatchingLogic:
         old_delivery = create_test_delivery(
             delivery_id="too-old",
             customer_name="John Doe",
-            street="123 Main St"
+            street="123 Main St",
+            created_at=now - timedelta(minutes=10)
         )
-        # Override createdAt manually
-        old_delivery.created_at = now - timedelta(minutes=10)
 
         mock_velide.get_full_global_snapshot.return_value = create_snapshot([old_delivery])
         strategy = DeliveryReconciliationStrategy(mock_velide, config)
@@ -390,7 +380,6 @@ class TestDeliveryReconciliationStrategyMatchingLogic:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_ignores_delivery_with_wrong_customer_name(self, mock_velide, config):
         """
         Verify that a delivery matching address and time is ignored
@@ -415,7 +404,6 @@ class TestDeliveryReconciliationStrategyMatchingLogic:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_selects_newest_delivery_when_multiple_matches_exist(self, mock_velide, config):
         """
         Verify that if multiple valid candidates exist, the strategy 
@@ -429,17 +417,17 @@ class TestDeliveryReconciliationStrategyMatchingLogic:
         older_match = create_test_delivery(
             delivery_id="older-id",
             customer_name="John Doe",
-            street="123 Main St"
+            street="123 Main St",
+            created_at=now - timedelta(minutes=3)
         )
-        older_match.created_at = now - timedelta(minutes=3)
 
         # 2. Valid match, newer (1 minute ago)
         newer_match = create_test_delivery(
             delivery_id="newer-id",
             customer_name="John Doe",
-            street="123 Main St"
+            street="123 Main St",
+            created_at=now - timedelta(minutes=1)
         )
-        newer_match.created_at = now - timedelta(minutes=1)
 
         # Return them in random order to ensure sorting works
         mock_velide.get_full_global_snapshot.return_value = create_snapshot([older_match, newer_match])
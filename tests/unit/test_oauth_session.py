@@ -0,0 +1,32 @@
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from utils.oauth_session import oauth_refresh_session
+
+
+class _DroppingHandler(BaseHTTPRequestHandler):
+    """Reads the request, then drops the connection without answering."""
+
+    requests_received = 0
+
+    def do_POST(self):
+        type(self).requests_received += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.mark.parametrize(
+    "local_oauth_server",
+    [(_DroppingHandler, oauth_refresh_session)],
+    indirect=True,
+)
+def test_refresh_is_not_sent_again_after_a_read_error(local_oauth_server):
+    with pytest.raises(requests.ConnectionError):
+        oauth_refresh_session.post(f"{local_oauth_server}/oauth/token", data=b"x=1")
+
+    assert _DroppingHandler.requests_received == 1
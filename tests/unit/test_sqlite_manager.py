@@ -0,0 +1,60 @@
+import os
+import sqlite3
+
+import pytest
+
+from api.sqlite_manager import DeliveryStatus, SQLiteManager
+from api.sqlite_pool import close_pool
+
+
+def test_write_succeeds_after_a_failed_commit(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    with SQLiteManager(db_path) as db:
+        db.conn.execute("CREATE TABLE Parent (id INTEGER PRIMARY KEY)")
+        db.conn.execute(
+            "CREATE TABLE Child (parent_id INTEGER REFERENCES Parent(id) "
+            "DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+    # The deferred foreign key is only checked on commit, which then fails
+    with SQLiteManager(db_path) as db:
+        db.conn.execute("INSERT INTO Child (parent_id) VALUES (1)")
+
+    with SQLiteManager(db_path) as db:
+        assert db.add_delivery_mapping("UUID-1", "1", DeliveryStatus.ADDED)
+
+    with SQLiteManager(db_path, read_only=True) as db:
+        assert db.get_delivery_by_internal_id("1") == ("UUID-1", DeliveryStatus.ADDED)
+        assert db.conn.execute("SELECT COUNT(*) FROM Child").fetchone() == (0,)
+
+
+def test_discarded_writer_is_reopened(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    manager = SQLiteManager(db_path)
+    manager.warm_up()
+    pool = manager._get_pool()
+
+    conn = pool.acquire_rw()
+    pool.discard(conn, read_only=False)
+
+    with SQLiteManager(db_path) as db:
+        assert db.conn is not conn
+        assert db.add_delivery_mapping("UUID-1", "1", DeliveryStatus.ADDED)
+
+
+def test_close_pool_checkpoints_and_a_new_pool_opens_after(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    with SQLiteManager(db_path) as db:
+        db.add_delivery_mapping("UUID-1", "1", DeliveryStatus.ADDED)
+    with SQLiteManager(db_path, read_only=True) as db:
+        db.get_delivery_by_internal_id("1")
+    old_pool = SQLiteManager(db_path)._get_pool()
+
+    close_pool(db_path)
+
+    # Closing the last connection folds the WAL back into the database
+    assert not os.path.exists(f"{db_path}-wal")
+    with pytest.raises(sqlite3.ProgrammingError):
+        old_pool.acquire_rw()
+    with SQLiteManager(db_path, read_only=True) as db:
+        assert db.get_delivery_by_internal_id("1") == ("UUID-1", DeliveryStatus.ADDED)
@@ -0,0 +1,15 @@
+from workers.sqlite_worker import SQLiteWorkerSignalsPool
+
+
+def test_released_signals_are_disconnected_and_reused():
+    pool = SQLiteWorkerSignalsPool()
+    signals = pool.acquire()
+    calls = []
+    signals.finished.connect(lambda: calls.append("finished"))
+
+    signals.finished.emit()
+    pool.release(signals)
+    signals.finished.emit()
+
+    assert calls == ["finished"]
+    assert pool.acquire() is signals
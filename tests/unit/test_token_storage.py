@@ -0,0 +1,43 @@
+import pytest
+
+from utils import token_storage
+from utils.token_storage import read_token_from_file, store_token_at_file
+
+TOKEN = {"access_token": "access", "refresh_token": "refresh"}
+
+
+@pytest.fixture(autouse=True)
+def bundle_dir(tmp_path, monkeypatch):
+    """Points the token file to a temporary folder, with an empty cache."""
+    monkeypatch.setattr(token_storage, "BUNDLE_DIR", str(tmp_path))
+    monkeypatch.setattr(token_storage, "_cached_token", None)
+    return tmp_path
+
+
+def test_missing_file_returns_none():
+    assert read_token_from_file() is None
+
+
+def test_unchanged_file_is_not_read_again(monkeypatch):
+    store_token_at_file(TOKEN)
+    assert read_token_from_file() == TOKEN
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("Token file opened again")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    token = read_token_from_file()
+
+    assert token == TOKEN
+    token["access_token"] = "changed"  # Callers get their own copy
+    assert read_token_from_file() == TOKEN
+
+
+def test_stored_token_replaces_cached_one():
+    store_token_at_file(TOKEN)
+    read_token_from_file()
+
+    new_token = {"access_token": "new", "refresh_token": "new"}
+    store_token_at_file(new_token)
+
+    assert read_token_from_file() == new_token
@@ -79,7 +79,6 @@ class TestVelideOnAddDeliveryException:
             reconciliation_config=None
         )
 
-    @pytest.mark.asyncio
     async def test_on_add_delivery_exception_only_triggers_on_timeout(
         self, velide_with_reconciliation
     ):
@@ -101,7 +100,6 @@ class TestVelideOnAddDeliveryException:
         # Assert
         assert result is None  # No reconciliation attempted
 
-    @pytest.mark.asyncio
     async def test_on_add_delivery_exception_returns_none_when_disabled(
         self, velide_without_reconciliation
     ):
@@ -123,7 +121,6 @@ class TestVelideOnAddDeliveryException:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_on_add_delivery_exception_performs_reconciliation_on_timeout(
         self, velide_with_reconciliation, reconciliation_config
     ):
@@ -170,7 +167,6 @@ class TestVelideOnAddDeliveryException:
         assert result.id == "velide-123"
         velide_with_reconciliation._reconciliation_strategy.check_exists.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_on_add_delivery_exception_returns_none_when_not_found(
         self, velide_with_reconciliation
     ):